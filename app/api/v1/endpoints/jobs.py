@@ -5,9 +5,6 @@ from typing import List, Optional
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, Field
 from datetime import datetime
-from app.scheduler.scheduler_manager import get_scheduler_manager
-from app.infrastructure.database.mongodb import get_mongodb_manager
-from app.infrastructure.database.repositories.telemetry_repository import TelemetryRepository
 from app.core.logging import get_logger
 
 router = APIRouter()
@@ -43,6 +40,8 @@ async def list_jobs():
     Returns:
         List of active scheduled jobs
     """
+    from app.scheduler.scheduler_manager import get_scheduler_manager
+    
     try:
         scheduler = get_scheduler_manager()
         jobs = scheduler.get_jobs()
@@ -72,6 +71,8 @@ async def pause_job(job_id: str):
     Args:
         job_id: Job identifier
     """
+    from app.scheduler.scheduler_manager import get_scheduler_manager
+    
     try:
         scheduler = get_scheduler_manager()
         scheduler.pause_job(job_id)
@@ -99,6 +100,8 @@ async def resume_job(job_id: str):
     Args:
         job_id: Job identifier
     """
+    from app.scheduler.scheduler_manager import get_scheduler_manager
+    
     try:
         scheduler = get_scheduler_manager()
         scheduler.resume_job(job_id)
@@ -127,6 +130,9 @@ async def get_job_history(job_name: str, limit: int = 10):
         job_name: Name of the job
         limit: Maximum number of records to return (default: 10)
     """
+    from app.infrastructure.database.mongodb import get_mongodb_manager
+    from app.infrastructure.database.repositories.telemetry_repository import TelemetryRepository
+    
     try:
         mongodb_manager = get_mongodb_manager()
         db = mongodb_manager.get_database()
@@ -161,6 +167,8 @@ async def get_job_statistics():
     """
     Get overall job execution statistics.
     """
+    from app.infrastructure.database.mongodb import get_mongodb_manager
+    
     try:
         mongodb_manager = get_mongodb_manager()
         db = mongodb_manager.get_database()
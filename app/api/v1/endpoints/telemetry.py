@@ -0,0 +1,58 @@
+"""
+Telemetry query endpoints.
+"""
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, Response, status
+
+from app.core.exceptions import RepositoryError
+from app.core.logging import get_logger
+
+router = APIRouter()
+logger = get_logger(__name__)
+
+
+@router.get("/{vin}")
+async def get_vehicle_telemetry(
+    vin: str,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    limit: int = Query(100, ge=1, le=1000)
+):
+    """
+    Get telemetry records for a vehicle, most recent first.
+
+    Documents are fetched from MongoDB as raw BSON and dumped to JSON in
+    one pass, without building VehicleTelemetry models.
+
+    Args:
+        vin: Vehicle Identification Number
+        start_date: Optional start date filter
+        end_date: Optional end date filter
+        limit: Maximum number of records to return (1-1000, default: 100)
+    """
+    from bson import json_util
+    from app.core.dependencies import get_container
+    
+    # Shared repository, so the indexed weeks recorded at startup are hinted
+    repository = get_container().get_repository()
+    if repository is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database not available"
+        )
+
+    try:
+        documents = await repository.find_by_vin_raw(vin, start_date, end_date, limit)
+    except RepositoryError as e:
+        logger.error(f"Failed to get telemetry for VIN {vin}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve telemetry"
+        ) from e
+
+    return Response(
+        content=json_util.dumps(documents),
+        media_type="application/json"
+    )
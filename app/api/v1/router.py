@@ -2,10 +2,11 @@
 API router aggregator for v1 endpoints.
 """
 from fastapi import APIRouter
-from app.api.v1.endpoints import health, jobs
+from app.api.v1.endpoints import health, jobs, telemetry
 
 api_router = APIRouter()
 
 # Include endpoint routers
 api_router.include_router(health.router, prefix="/health", tags=["Health"])
-api_router.include_router(jobs.router, prefix="/jobs", tags=["Jobs"])
\ No newline at end of file
+api_router.include_router(jobs.router, prefix="/jobs", tags=["Jobs"])
+api_router.include_router(telemetry.router, prefix="/telemetry", tags=["Telemetry"])
\ No newline at end of file
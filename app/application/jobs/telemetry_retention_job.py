@@ -0,0 +1,51 @@
+"""
+Telemetry retention job.
+Drops weekly telemetry collections that fall outside the retention window.
+"""
+from datetime import datetime
+from typing import Optional
+
+from app.core.logging import get_logger
+from app.domain.models.enums import IngestionStatus
+from app.domain.models.vehicle_telemetry import JobExecutionLog
+from app.infrastructure.database.repositories.telemetry_repository import TelemetryRepository
+
+logger = get_logger(__name__)
+
+
+async def run_telemetry_retention_job(repository: Optional[TelemetryRepository]):
+    """Telemetry retention job."""
+    job_log = JobExecutionLog(
+        job_name="telemetry_retention",
+        job_type="data_retention",
+        start_time=datetime.utcnow()
+    )
+
+    if repository is None:
+        logger.warning("Telemetry retention skipped - repository not available")
+        return job_log
+
+    try:
+        logger.info("Starting telemetry retention cleanup")
+
+        dropped = await repository.drop_expired_collections()
+
+        job_log.end_time = datetime.utcnow()
+        job_log.status = IngestionStatus.SUCCESS
+        job_log.execution_metadata = {"dropped_collections": dropped}
+
+        await repository.insert_job_log(job_log)
+
+        logger.info(f"Telemetry retention completed - Dropped: {len(dropped)} collections")
+
+        return job_log
+
+    except Exception as e:
+        logger.error("Telemetry retention job failed", exc_info=True)
+        job_log.end_time = datetime.utcnow()
+        job_log.status = IngestionStatus.FAILED
+        job_log.error_summary = {"critical_error": str(e)}
+
+        await repository.insert_job_log(job_log)
+
+        return job_log
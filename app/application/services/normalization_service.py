@@ -2,7 +2,7 @@
 Data normalization service.
 Transforms GPS provider-specific data into canonical domain models.
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Mapping, Optional
 from datetime import datetime
 from decimal import Decimal
 from app.domain.models.vehicle_telemetry import (
@@ -30,6 +30,20 @@ from app.core.exceptions import DataNormalizationError
 logger = get_logger(__name__)
 
 
+def _to_builtin(value: Any) -> Any:
+    """
+    Recursively copy provider payloads into plain dicts and lists.
+    
+    Providers may hand out read-only views (e.g. MappingProxyType, tuples);
+    anything stored on a model must be a mutable, serializable copy.
+    """
+    if isinstance(value, Mapping):
+        return {key: _to_builtin(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_builtin(item) for item in value]
+    return value
+
+
 class DataNormalizationService:
     """
     Service responsible for normalizing GPS provider data.
@@ -483,6 +497,6 @@ class DataNormalizationService:
             provider_name=self.provider_name,
             report_type=report_type,
             data_quality=quality,
-            raw_data=raw_data,
+            raw_data=_to_builtin(raw_data),
             ingestion_status=IngestionStatus.SUCCESS
         )
\ No newline at end of file
@@ -2,11 +2,15 @@
 Configuration management using Pydantic Settings.
 Supports environment-based configuration with validation.
 """
+import re
 from functools import lru_cache
 from typing import Optional, List
 from pydantic import Field, field_validator, MongoDsn
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# One crontab field: numbers, names (mon, jan), *, ranges, steps and lists
+CRON_FIELD_PATTERN = re.compile(r"^[\w*/,\-]+$")
+
 
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
@@ -47,9 +51,10 @@ class Settings(BaseSettings):
     # MongoDB Configuration
     MONGODB_URL: str = "mongodb://localhost:27017"
     MONGODB_DB_NAME: str = "gps_telemetry"
-    MONGODB_MIN_POOL_SIZE: int = 10
-    MONGODB_MAX_POOL_SIZE: int = 100
+    MONGODB_MIN_POOL_SIZE: int = 20  # also the number of connections pre-warmed at startup
+    MONGODB_MAX_POOL_SIZE: int = 200  # headroom for asyncio.gather fan-out over repository calls
     MONGODB_MAX_IDLE_TIME_MS: int = 45000
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS: int = 5000
     
     # Development Mode
     ALLOW_MONGODB_FAILURE: bool = False
@@ -58,12 +63,19 @@ class Settings(BaseSettings):
     TELEMETRY_COLLECTION: str = "vehicle_telemetry"
     JOB_EXECUTION_LOG_COLLECTION: str = "job_execution_logs"
     
+    # Telemetry Writes (append-only; duplicates are tolerated)
+    TELEMETRY_WRITE_CONCERN_W: int = 1
+    TELEMETRY_RETRY_WRITES: bool = False  # False = dedicated client with retryWrites disabled
+    TELEMETRY_WRITE_MAX_POOL_SIZE: int = 10  # pool of the dedicated writer client; kept small
+    
     # Scheduler Configuration
     SCHEDULER_TIMEZONE: str = "America/Mexico_City"
+    SCHEDULER_JOBSTORE: str = "memory"  # "memory" or "mongodb" (reuses the app's MongoDB client)
+    SCHEDULER_JOBSTORE_COLLECTION: str = "apscheduler_jobs"
     SCHEDULER_JOB_DEFAULTS: dict = {
         "coalesce": True,
-        "max_instances": 1,
-        "misfire_grace_time": 300  # 5 minutes
+        "max_instances": 3,  # let a slow run overlap the next tick instead of skipping it
+        "misfire_grace_time": 60  # 1 minute
     }
     
     # Job Schedules (Cron expressions)
@@ -73,8 +85,9 @@ class Settings(BaseSettings):
     JOB_SPEED_MONITORING_CRON: str = "*/5 * * * *"  # Every 5 minutes
     JOB_IGNITION_CRON: str = "*/15 * * * *"  # Every 15 minutes
     JOB_VOLTAGE_HEALTH_CRON: str = "0 0 * * *"  # Daily at midnight
+    JOB_TELEMETRY_RETENTION_CRON: str = "30 0 * * *"  # Daily at 00:30
     
-    # Data Retention
+    # Data Retention (telemetry is dropped per weekly collection)
     TELEMETRY_RETENTION_DAYS: int = 90
     JOB_LOG_RETENTION_DAYS: int = 30
     
@@ -97,6 +110,31 @@ class Settings(BaseSettings):
             raise ValueError("MONGODB_URL must start with mongodb:// or mongodb+srv://")
         return v
     
+    @field_validator(
+        "JOB_VEHICLE_POSITION_CRON",
+        "JOB_ODOMETER_CRON",
+        "JOB_ENGINE_STATUS_CRON",
+        "JOB_SPEED_MONITORING_CRON",
+        "JOB_IGNITION_CRON",
+        "JOB_VOLTAGE_HEALTH_CRON",
+        "JOB_TELEMETRY_RETENTION_CRON"
+    )
+    @classmethod
+    def validate_cron_expression(cls, v: str) -> str:
+        """
+        Fail fast on malformed crontab expressions.
+        
+        Only the shape is checked here, so building Settings does not import
+        APScheduler; field values are parsed when the scheduler builds triggers.
+        """
+        fields = v.split()
+        if len(fields) != 5 or not all(CRON_FIELD_PATTERN.match(field) for field in fields):
+            raise ValueError(
+                f"Invalid cron expression '{v}': expected 5 fields "
+                "(minute hour day month day_of_week)"
+            )
+        return v
+    
     @property
     def is_production(self) -> bool:
         return self.ENVIRONMENT == "production"
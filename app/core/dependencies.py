@@ -2,6 +2,8 @@
 Dependency injection container.
 Provides centralized dependency management.
 """
+import asyncio
+from functools import lru_cache
 from typing import Optional
 from app.domain.interfaces.gps_provider import IGPSProvider
 from app.infrastructure.gps_providers.mock_provider import MockGPSProvider
@@ -31,6 +33,17 @@ class DependencyContainer:
         """Initialize all dependencies."""
         logger.info("Initializing dependency container")
         
+        await self.initialize_services()
+        await self.initialize_repositories()
+        
+        logger.info("Dependency container initialized successfully")
+    
+    async def initialize_services(self):
+        """
+        Initialize dependencies that do not need MongoDB.
+        
+        Safe to run concurrently with MongoDB connect.
+        """
         # Initialize GPS provider
         self._gps_provider = await self._create_gps_provider()
         
@@ -38,25 +51,34 @@ class DependencyContainer:
         self._normalization_service = DataNormalizationService(
             provider_name=self._gps_provider.get_provider_name()
         )
+    
+    async def initialize_repositories(self):
+        """
+        Initialize MongoDB-backed repositories.
         
-        # Initialize repository
+        Must run after MongoDB connect; leaves repositories unset if not connected.
+        """
         mongodb_manager = get_mongodb_manager()
         db = mongodb_manager.get_database()
         
         if db is not None:
-            self._repository = TelemetryRepository(db)
-            await self._repository.ensure_indexes()
-            logger.info("Telemetry repository initialized with MongoDB connection")
-            
+            self._repository = TelemetryRepository(
+                db,
+                write_db=mongodb_manager.get_telemetry_write_database()
+            )
             self._vehicle_repository = VehicleRepository(db)
-            await self._vehicle_repository.ensure_indexes()
+            
+            # Index builds on separate collections are independent
+            await asyncio.gather(
+                self._repository.ensure_indexes(),
+                self._vehicle_repository.ensure_indexes()
+            )
+            logger.info("Telemetry repository initialized with MongoDB connection")
             logger.info("Vehicle repository initialized with MongoDB connection")
         else:
             logger.warning("Repositories not initialized - MongoDB not connected")
             self._repository = None
             self._vehicle_repository = None
-        
-        logger.info("Dependency container initialized successfully")
     
     async def _create_gps_provider(self) -> IGPSProvider:
         """Create GPS provider based on configuration."""
@@ -112,13 +134,7 @@ class DependencyContainer:
         logger.info("Dependency container cleaned up")
 
 
-# Global container instance
-_container: Optional[DependencyContainer] = None
-
-
+@lru_cache()
 def get_container() -> DependencyContainer:
     """Get global dependency container instance."""
-    global _container
-    if _container is None:
-        _container = DependencyContainer()
-    return _container
\ No newline at end of file
+    return DependencyContainer()
\ No newline at end of file
@@ -5,6 +5,7 @@ Enables swapping between mock and real implementations without code changes.
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+import orjson
 from app.domain.models.enums import ReportType
 
 
@@ -45,6 +46,26 @@ class IGPSProvider(ABC):
         """
         pass
     
+    async def get_report_bytes(
+        self,
+        report_type: ReportType,
+        **kwargs
+    ) -> bytes:
+        """
+        Fetch a report as serialized JSON bytes.
+        
+        Lets callers that only forward the payload skip JSON encoding.
+        Providers with a cheaper source of bytes should override this.
+        
+        Args:
+            report_type: Type of report to fetch
+            **kwargs: Additional parameters (VIN, date ranges, etc.)
+            
+        Returns:
+            bytes: JSON-encoded report
+        """
+        return orjson.dumps(await self.get_report(report_type, **kwargs))
+    
     @abstractmethod
     async def get_vehicle_data_by_vin(
         self,
@@ -24,6 +24,8 @@ class Vehicle(BaseModel):
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     
     class Config:
+        frozen = True  # instances are never mutated; updates go through the repository
+        extra = "forbid"
         json_encoders = {
             datetime: lambda v: v.isoformat()
         }
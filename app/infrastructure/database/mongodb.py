@@ -2,6 +2,8 @@
 MongoDB connection manager for MongoDB Atlas.
 Handles connection lifecycle and provides database instance.
 """
+import asyncio
+from functools import lru_cache
 from typing import Optional, Union
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
@@ -21,6 +23,7 @@ class MongoDBManager:
     def __init__(self):
         self._client: Optional[AsyncIOMotorClient] = None
         self._db: Optional[AsyncIOMotorDatabase] = None
+        self._telemetry_write_client: Optional[AsyncIOMotorClient] = None
     
     async def connect(self) -> AsyncIOMotorDatabase:
         """
@@ -45,6 +48,7 @@ class MongoDBManager:
                 minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
                 maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
                 maxIdleTimeMS=settings.MONGODB_MAX_IDLE_TIME_MS,
+                waitQueueTimeoutMS=settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS,
                 serverSelectionTimeoutMS=10000,  # 10 seconds timeout
                 connectTimeoutMS=20000,  # 20 seconds connect timeout
                 retryWrites=True,  # Enable retry writes for transient errors
@@ -57,6 +61,21 @@ class MongoDBManager:
             
             # Test connection
             await self._client.admin.command('ping')
+            await self._warm_connection_pool()
+            
+            # Telemetry inserts are append-only, so skip retryable-write bookkeeping on them;
+            # retryWrites is client-wide, so this needs its own (small) client
+            if not settings.TELEMETRY_RETRY_WRITES:
+                self._telemetry_write_client = AsyncIOMotorClient(
+                    settings.MONGODB_URL,
+                    maxPoolSize=settings.TELEMETRY_WRITE_MAX_POOL_SIZE,
+                    maxIdleTimeMS=settings.MONGODB_MAX_IDLE_TIME_MS,
+                    waitQueueTimeoutMS=settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+                    serverSelectionTimeoutMS=10000,
+                    connectTimeoutMS=20000,
+                    retryWrites=False,
+                    appName="GPS-Data-Collection-Service-Telemetry-Writer"
+                )
             
             # Create basic collections for first-time setup
             try:
@@ -138,12 +157,32 @@ class MongoDBManager:
                 }
             ) from e
     
+    async def _warm_connection_pool(self):
+        """
+        Open MONGODB_MIN_POOL_SIZE connections up front with concurrent pings.
+        
+        minPoolSize is filled in the background, so the first burst of
+        concurrent repository calls would otherwise pay TCP/TLS setup.
+        """
+        await asyncio.gather(*(
+            self._client.admin.command('ping')
+            for _ in range(settings.MONGODB_MIN_POOL_SIZE)
+        ))
+        
+        logger.info(
+            "MongoDB connection pool warmed",
+            extra={"connections": settings.MONGODB_MIN_POOL_SIZE}
+        )
+    
     async def disconnect(self):
         """Close MongoDB connection gracefully."""
         if self._client:
             logger.info("Closing MongoDB connection")
             self._client.close()
             self._client = None
+            if self._telemetry_write_client:
+                self._telemetry_write_client.close()
+                self._telemetry_write_client = None
             self._db = None
             logger.info("MongoDB connection closed")
     
@@ -174,6 +213,19 @@ class MongoDBManager:
         """
         return self._db
     
+    def get_telemetry_write_database(self) -> Optional[AsyncIOMotorDatabase]:
+        """
+        Get database instance used for telemetry inserts.
+        
+        Returns:
+            Database bound to the retryWrites=False client when configured,
+            otherwise the primary database (None if not connected)
+        """
+        if self._telemetry_write_client is not None and self._db is not None:
+            return self._telemetry_write_client[settings.MONGODB_DB_NAME]
+        
+        return self._db
+    
     def get_client(self) -> AsyncIOMotorClient:
         """
         Get MongoDB client instance.
@@ -190,10 +242,7 @@ class MongoDBManager:
         return self._client
 
 
-# Global MongoDB manager instance
-_mongodb_manager: Optional[MongoDBManager] = None
-
-
+@lru_cache()
 def get_mongodb_manager() -> MongoDBManager:
     """
     Get global MongoDB manager instance (Singleton).
@@ -201,7 +250,4 @@ def get_mongodb_manager() -> MongoDBManager:
     Returns:
         MongoDBManager instance
     """
-    global _mongodb_manager
-    if _mongodb_manager is None:
-        _mongodb_manager = MongoDBManager()
-    return _mongodb_manager
\ No newline at end of file
+    return MongoDBManager()
\ No newline at end of file
@@ -1,20 +1,85 @@
 """
 MongoDB repository for vehicle telemetry data.
 Implements repository pattern with async operations.
+
+Telemetry is partitioned into weekly collections
+(``<TELEMETRY_COLLECTION>_<iso_year>_w<iso_week>``) keyed on insert time,
+so retention is enforced by dropping whole collections instead of a TTL index.
+Records written before partitioning stay in the legacy ``<TELEMETRY_COLLECTION>``
+collection, which is still read until its newest record falls outside the
+retention window and the collection is dropped. Its TTL index never fires,
+because timestamps are stored as ISO strings rather than BSON dates.
 """
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timedelta
-from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorCollection
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
 from pymongo import ASCENDING, DESCENDING
 from pymongo.errors import DuplicateKeyError, PyMongoError
-from app.domain.models.vehicle_telemetry import VehicleTelemetry, JobExecutionLog
-from app.domain.models.enums import ReportType, VehicleEventType
+from pymongo.write_concern import WriteConcern
+
 from app.core.config import settings
-from app.core.logging import get_logger
 from app.core.exceptions import RepositoryError
+from app.core.logging import get_logger
+from app.domain.models.enums import ReportType, VehicleEventType
+from app.domain.models.vehicle_telemetry import JobExecutionLog, VehicleTelemetry
 
 logger = get_logger(__name__)
 
+# Upper bound on documents per cursor batch, so large reads decode while the next batch is in flight
+CURSOR_BATCH_SIZE = 1000
+
+WEEKLY_COLLECTION_PATTERN = re.compile(
+    rf"^{re.escape(settings.TELEMETRY_COLLECTION)}_(\d{{4}})_w(\d{{2}})$"
+)
+
+RAW_CODEC_OPTIONS = CodecOptions(document_class=RawBSONDocument)
+
+
+def weekly_collection_name(moment: datetime) -> str:
+    """Return the weekly telemetry collection name for a UTC datetime."""
+    iso_year, iso_week, _ = moment.isocalendar()
+    return f"{settings.TELEMETRY_COLLECTION}_{iso_year}_w{iso_week:02d}"
+
+
+def weekly_collection_end(name: str) -> Optional[datetime]:
+    """
+    Return the (exclusive) end of the ISO week a weekly collection covers.
+    
+    Returns None for names that are not valid weekly collection names,
+    including out-of-range weeks such as ``_w00`` or ``_w54``.
+    """
+    match = WEEKLY_COLLECTION_PATTERN.match(name)
+    if not match:
+        return None
+    
+    try:
+        week_start = datetime.fromisocalendar(int(match.group(1)), int(match.group(2)), 1)
+    except ValueError:
+        return None
+    
+    return week_start + timedelta(days=7)
+
+
+def _to_naive_utc(moment: datetime) -> datetime:
+    """Normalize aware datetimes to the naive-UTC convention used for storage."""
+    if moment.tzinfo is not None:
+        return moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment
+
+
+def _stored_timestamp(moment: datetime) -> str:
+    """
+    Format a filter bound the way timestamps are stored.
+    
+    Documents are written with model_dump(mode='json'), so recorded_at is an
+    ISO-8601 string and range filters must compare strings, not BSON dates.
+    """
+    return _to_naive_utc(moment).isoformat()
+
 
 class TelemetryRepository:
     """
@@ -22,41 +87,97 @@ class TelemetryRepository:
     Handles all MongoDB operations for telemetry records.
     """
     
-    def __init__(self, db: AsyncIOMotorDatabase):
+    # Index specs, also used as query hints
+    VIN_RECORDED_IDX = [("vin", ASCENDING), ("recorded_at", DESCENDING)]
+    REPORT_RECORDED_IDX = [("metadata.report_type", ASCENDING), ("recorded_at", DESCENDING)]
+    EVENT_RECORDED_IDX = [("event_type", ASCENDING), ("recorded_at", DESCENDING)]
+    
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase,
+        write_db: Optional[AsyncIOMotorDatabase] = None
+    ):
         """
         Initialize repository with database connection.
         
         Args:
             db: Motor async MongoDB database instance
+            write_db: Optional database used for telemetry inserts
+                (e.g. bound to a client with retryable writes disabled)
         """
         self.db = db
-        self.collection: AsyncIOMotorCollection = db[settings.TELEMETRY_COLLECTION]
+        self._write_db = write_db if write_db is not None else db
+        self._write_concern = WriteConcern(w=settings.TELEMETRY_WRITE_CONCERN_W)
         self.job_log_collection: AsyncIOMotorCollection = db[settings.JOB_EXECUTION_LOG_COLLECTION]
+        
+        # Weekly collections known to carry the query indexes; only these get hinted
+        self._indexed_collections: set[str] = set()
+    
+    @property
+    def collection(self) -> AsyncIOMotorCollection:
+        """Current week's telemetry collection."""
+        return self.db[self._current_collection_name()]
+    
+    def _current_collection_name(self) -> str:
+        """Name of the weekly collection receiving inserts right now."""
+        return weekly_collection_name(datetime.utcnow())
+    
+    def _collection_names(self, start_date: Optional[datetime] = None) -> List[str]:
+        """
+        Telemetry collection names that may hold matching records, newest first.
+        
+        Records are partitioned by insert time, which is never earlier than
+        their recorded_at, so weeks ending before start_date can be skipped.
+        The legacy unpartitioned collection is always last.
+        """
+        now = datetime.utcnow()
+        oldest = now - timedelta(days=settings.TELEMETRY_RETENTION_DAYS)
+        if start_date and _to_naive_utc(start_date) > oldest:
+            oldest = _to_naive_utc(start_date)
+        
+        oldest_name = weekly_collection_name(oldest)
+        names = [weekly_collection_name(now)]
+        moment = now
+        
+        while names[-1] != oldest_name and moment > oldest:
+            moment -= timedelta(days=7)
+            names.append(weekly_collection_name(moment))
+        
+        names.append(settings.TELEMETRY_COLLECTION)
+        return names
+    
+    def _read_collection(self, name: str, raw: bool = False) -> AsyncIOMotorCollection:
+        """Get a weekly collection handle, optionally decoding to RawBSONDocument."""
+        if raw:
+            return self.db.get_collection(name, codec_options=RAW_CODEC_OPTIONS)
+        return self.db[name]
+    
+    async def _write_collection(self) -> AsyncIOMotorCollection:
+        """Get the current week's collection for inserts, indexing it on first use."""
+        name = self._current_collection_name()
+        if name not in self._indexed_collections:
+            await self._ensure_collection_indexes(name)
+        return self._write_db.get_collection(name, write_concern=self._write_concern)
+    
+    async def _ensure_collection_indexes(self, name: str):
+        """Create query indexes on a weekly telemetry collection."""
+        collection = self.db[name]
+        await collection.create_index(self.VIN_RECORDED_IDX)
+        await collection.create_index(self.REPORT_RECORDED_IDX)
+        await collection.create_index(self.EVENT_RECORDED_IDX)
+        self._indexed_collections.add(name)
     
     async def ensure_indexes(self):
         """Create indexes for optimized queries."""
         try:
-            # Compound index for common queries
-            await self.collection.create_index([
-                ("vin", ASCENDING),
-                ("recorded_at", DESCENDING)
-            ])
-            
-            await self.collection.create_index([
-                ("metadata.report_type", ASCENDING),
-                ("recorded_at", DESCENDING)
-            ])
-            
-            await self.collection.create_index([
-                ("event_type", ASCENDING),
-                ("recorded_at", DESCENDING)
-            ])
-            
-            # TTL index for data retention
-            await self.collection.create_index(
-                "created_at",
-                expireAfterSeconds=settings.TELEMETRY_RETENTION_DAYS * 86400
+            # Current week plus any retained weeks created by earlier runs
+            existing = await self.db.list_collection_names(
+                filter={"name": {"$regex": WEEKLY_COLLECTION_PATTERN.pattern}}
             )
+            retained = set(self._collection_names()) - {settings.TELEMETRY_COLLECTION}
+            
+            for name in {self._current_collection_name(), *(n for n in existing if n in retained)}:
+                await self._ensure_collection_indexes(name)
             
             # Job execution log indexes
             await self.job_log_collection.create_index([
@@ -75,6 +196,63 @@ class TelemetryRepository:
             logger.error("Failed to create indexes", exc_info=True)
             raise RepositoryError("Index creation failed", details={"error": str(e)}) from e
     
+    async def drop_expired_collections(self) -> List[str]:
+        """
+        Drop weekly telemetry collections older than the retention window.
+        
+        Collections whose names do not parse as an ISO week are skipped. The
+        legacy collection is dropped once none of its records was created
+        within the retention window.
+        
+        Returns:
+            List of dropped collection names
+            
+        Raises:
+            RepositoryError: If listing or dropping collections fails
+        """
+        try:
+            cutoff = datetime.utcnow() - timedelta(days=settings.TELEMETRY_RETENTION_DAYS)
+            names = await self.db.list_collection_names(
+                filter={"name": {"$regex": WEEKLY_COLLECTION_PATTERN.pattern}}
+            )
+            
+            dropped = []
+            for name in sorted(names):
+                week_end = weekly_collection_end(name)
+                if week_end is None:
+                    logger.warning(
+                        f"Skipping unparsable telemetry collection {name}",
+                        extra={"collection": name}
+                    )
+                    continue
+                
+                if week_end <= cutoff:
+                    await self.db.drop_collection(name)
+                    self._indexed_collections.discard(name)
+                    dropped.append(name)
+            
+            legacy = settings.TELEMETRY_COLLECTION
+            if legacy in await self.db.list_collection_names(filter={"name": legacy}):
+                # created_at is normally an ISO string; also match BSON dates
+                recent = {"$or": [
+                    {"created_at": {"$gte": _stored_timestamp(cutoff)}},
+                    {"created_at": {"$gte": cutoff}}
+                ]}
+                if await self.db[legacy].find_one(recent, {"_id": 1}) is None:
+                    await self.db.drop_collection(legacy)
+                    dropped.append(legacy)
+            
+            logger.info(
+                f"Dropped {len(dropped)} expired telemetry collections",
+                extra={"collections": dropped}
+            )
+            
+            return dropped
+            
+        except PyMongoError as e:
+            logger.error("Failed to drop expired telemetry collections", exc_info=True)
+            raise RepositoryError("Retention cleanup failed", details={"error": str(e)}) from e
+    
     async def insert_one(self, telemetry: VehicleTelemetry) -> str:
         """
         Insert a single telemetry record.
@@ -90,7 +268,8 @@ class TelemetryRepository:
         """
         try:
             document = telemetry.model_dump(mode='json')
-            result = await self.collection.insert_one(document)
+            collection = await self._write_collection()
+            result = await collection.insert_one(document)
             
             logger.debug(
                 f"Inserted telemetry for VIN {telemetry.vin}",
@@ -123,8 +302,11 @@ class TelemetryRepository:
             return []
         
         try:
-            documents = [record.model_dump(mode='json') for record in telemetry_records]
-            result = await self.collection.insert_many(documents, ordered=False)
+            # Call the compiled serializer directly; same output as model_dump(mode='json')
+            serializer = VehicleTelemetry.__pydantic_serializer__
+            documents = [serializer.to_python(record, mode='json') for record in telemetry_records]
+            collection = await self._write_collection()
+            result = await collection.insert_many(documents, ordered=False)
             
             logger.info(
                 f"Inserted {len(result.inserted_ids)} telemetry records",
@@ -140,6 +322,80 @@ class TelemetryRepository:
                 details={"count": len(telemetry_records), "error": str(e)}
             ) from e
     
+    @staticmethod
+    def _newest_first_stages(query: Dict[str, Any], limit: int) -> List[Dict[str, Any]]:
+        """Per-collection stages: match, then take the newest `limit` via the index order."""
+        return [
+            {"$match": query},
+            {"$sort": {"recorded_at": DESCENDING}},
+            {"$limit": limit}
+        ]
+    
+    def _newest_first_pipeline(
+        self,
+        query: Dict[str, Any],
+        start_date: Optional[datetime],
+        limit: int
+    ) -> tuple[str, List[Dict[str, Any]]]:
+        """
+        Build the newest-first aggregate over every retained week.
+        
+        Returns the collection to run it on (the newest week) and the
+        pipeline; older weeks are pulled in with $unionWith, each trimmed
+        to `limit` server-side.
+        """
+        newest, *older = self._collection_names(start_date)
+        stages = self._newest_first_stages(query, limit)
+        
+        pipeline = list(stages)
+        pipeline.extend({"$unionWith": {"coll": name, "pipeline": stages}} for name in older)
+        if older:
+            pipeline.extend([{"$sort": {"recorded_at": DESCENDING}}, {"$limit": limit}])
+        
+        return newest, pipeline
+    
+    async def _find_newest_first(
+        self,
+        query: Dict[str, Any],
+        start_date: Optional[datetime],
+        limit: int,
+        hint: list,
+        raw: bool = False
+    ) -> list:
+        """
+        Query every retained week in one aggregate, newest first.
+        
+        The whole read is a single round-trip on one pooled connection.
+        Only the newest collection can take the hint; the unioned
+        sub-pipelines rely on the planner picking the same index.
+        """
+        newest, pipeline = self._newest_first_pipeline(query, start_date, limit)
+        
+        options: Dict[str, Any] = {"batchSize": min(CURSOR_BATCH_SIZE, limit)}
+        if newest in self._indexed_collections:
+            options["hint"] = hint
+        
+        cursor = self._read_collection(newest, raw=raw).aggregate(pipeline, **options)
+        return await cursor.to_list(length=limit)
+    
+    @staticmethod
+    def _vin_query(
+        vin: str,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> Dict[str, Any]:
+        """Filter for per-VIN reads with an optional recorded_at range."""
+        query: Dict[str, Any] = {"vin": vin}
+        
+        if start_date or end_date:
+            query["recorded_at"] = {}
+            if start_date:
+                query["recorded_at"]["$gte"] = _stored_timestamp(start_date)
+            if end_date:
+                query["recorded_at"]["$lte"] = _stored_timestamp(end_date)
+        
+        return query
+    
     async def find_by_vin(
         self,
         vin: str,
@@ -160,17 +416,12 @@ class TelemetryRepository:
             List of VehicleTelemetry objects
         """
         try:
-            query = {"vin": vin}
-            
-            if start_date or end_date:
-                query["recorded_at"] = {}
-                if start_date:
-                    query["recorded_at"]["$gte"] = start_date
-                if end_date:
-                    query["recorded_at"]["$lte"] = end_date
-            
-            cursor = self.collection.find(query).sort("recorded_at", DESCENDING).limit(limit)
-            documents = await cursor.to_list(length=limit)
+            documents = await self._find_newest_first(
+                self._vin_query(vin, start_date, end_date),
+                start_date,
+                limit,
+                self.VIN_RECORDED_IDX
+            )
             
             return [VehicleTelemetry(**doc) for doc in documents]
             
@@ -181,6 +432,91 @@ class TelemetryRepository:
                 details={"vin": vin, "error": str(e)}
             ) from e
     
+    async def find_by_vin_raw(
+        self,
+        vin: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100
+    ) -> List[RawBSONDocument]:
+        """
+        Find telemetry records by VIN without decoding them into models.
+        
+        Intended for callers that only serialize the documents back out
+        (e.g. API handlers using bson.json_util), skipping the
+        BSON -> dict -> VehicleTelemetry round-trip.
+        
+        Args:
+            vin: Vehicle Identification Number
+            start_date: Optional start date filter
+            end_date: Optional end date filter
+            limit: Maximum number of records to return
+            
+        Returns:
+            List of RawBSONDocument objects
+        """
+        try:
+            return await self._find_newest_first(
+                self._vin_query(vin, start_date, end_date),
+                start_date,
+                limit,
+                self.VIN_RECORDED_IDX,
+                raw=True
+            )
+            
+        except PyMongoError as e:
+            logger.error(f"Raw query failed for VIN {vin}", exc_info=True)
+            raise RepositoryError(
+                "Query operation failed",
+                details={"vin": vin, "error": str(e)}
+            ) from e
+    
+    async def explain_find_by_vin(
+        self,
+        vin: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100,
+        hint: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Return the query plan MongoDB uses for find_by_vin.
+        
+        Explains the same aggregate find_by_vin runs, so the output holds a
+        plan for the newest week plus one per $unionWith sub-pipeline. The
+        (vin ASC, recorded_at DESC) index already stores entries in the
+        requested order, so no collection's winning plan should need a
+        blocking SORT stage. Pass hint=False to check that the planner
+        picks the index on its own.
+        
+        Args:
+            vin: Vehicle Identification Number
+            start_date: Optional start date filter
+            end_date: Optional end date filter
+            limit: Maximum number of records to return
+            hint: Whether to hint the index, as find_by_vin does when it is known to exist
+            
+        Returns:
+            Dict containing the explain output (including executionStats)
+        """
+        try:
+            newest, pipeline = self._newest_first_pipeline(
+                self._vin_query(vin, start_date, end_date), start_date, limit
+            )
+            
+            command: Dict[str, Any] = {"aggregate": newest, "pipeline": pipeline, "cursor": {}}
+            if hint and newest in self._indexed_collections:
+                command["hint"] = dict(self.VIN_RECORDED_IDX)
+            
+            return await self.db.command("explain", command, verbosity="executionStats")
+            
+        except PyMongoError as e:
+            logger.error(f"Explain failed for VIN {vin}", exc_info=True)
+            raise RepositoryError(
+                "Explain operation failed",
+                details={"vin": vin, "error": str(e)}
+            ) from e
+    
     async def find_by_event_type(
         self,
         event_type: VehicleEventType,
@@ -202,10 +538,11 @@ class TelemetryRepository:
             query = {"event_type": event_type.value}
             
             if start_date:
-                query["recorded_at"] = {"$gte": start_date}
+                query["recorded_at"] = {"$gte": _stored_timestamp(start_date)}
             
-            cursor = self.collection.find(query).sort("recorded_at", DESCENDING).limit(limit)
-            documents = await cursor.to_list(length=limit)
+            documents = await self._find_newest_first(
+                query, start_date, limit, self.EVENT_RECORDED_IDX
+            )
             
             return [VehicleTelemetry(**doc) for doc in documents]
             
@@ -232,13 +569,15 @@ class TelemetryRepository:
             VehicleTelemetry object or None if not found
         """
         try:
-            document = await self.collection.find_one(
+            documents = await self._find_newest_first(
                 {"vin": vin, "metadata.report_type": report_type.value},
-                sort=[("recorded_at", DESCENDING)]
+                None,
+                1,
+                self.VIN_RECORDED_IDX
             )
             
-            if document:
-                return VehicleTelemetry(**document)
+            if documents:
+                return VehicleTelemetry(**documents[0])
             
             return None
             
@@ -269,42 +608,40 @@ class TelemetryRepository:
             if start_date or end_date:
                 match_stage["recorded_at"] = {}
                 if start_date:
-                    match_stage["recorded_at"]["$gte"] = start_date
+                    match_stage["recorded_at"]["$gte"] = _stored_timestamp(start_date)
                 if end_date:
-                    match_stage["recorded_at"]["$lte"] = end_date
-            
-            pipeline = [
-                {"$match": match_stage} if match_stage else {"$match": {}},
-                {
-                    "$group": {
-                        "_id": None,
-                        "total_records": {"$sum": 1},
-                        "unique_vins": {"$addToSet": "$vin"},
-                        "report_types": {"$addToSet": "$metadata.report_type"},
-                        "event_types": {"$addToSet": "$event_type"}
-                    }
-                },
-                {
-                    "$project": {
-                        "total_records": 1,
-                        "unique_vehicle_count": {"$size": "$unique_vins"},
-                        "report_types": 1,
-                        "event_types": 1
-                    }
+                    match_stage["recorded_at"]["$lte"] = _stored_timestamp(end_date)
+            
+            newest, *older = self._collection_names(start_date)
+            
+            # Single round-trip: older weeks are unioned in server-side and
+            # every facet consumes the same matched stream
+            pipeline = [{"$match": match_stage}]
+            pipeline.extend(
+                {"$unionWith": {"coll": name, "pipeline": [{"$match": match_stage}]}}
+                for name in older
+            )
+            pipeline.append({
+                "$facet": {
+                    "total": [{"$count": "n"}],
+                    "unique_vins": [{"$group": {"_id": "$vin"}}, {"$count": "n"}],
+                    "report_types": [{"$group": {"_id": "$metadata.report_type"}}],
+                    "event_types": [{"$group": {"_id": "$event_type"}}]
                 }
-            ]
+            })
             
-            cursor = self.collection.aggregate(pipeline)
+            cursor = self.db[newest].aggregate(pipeline)
             results = await cursor.to_list(length=1)
+            facets = results[0] if results else {}
             
-            if results:
-                return results[0]
+            total = facets.get("total") or [{"n": 0}]
+            unique_vins = facets.get("unique_vins") or [{"n": 0}]
             
             return {
-                "total_records": 0,
-                "unique_vehicle_count": 0,
-                "report_types": [],
-                "event_types": []
+                "total_records": total[0]["n"],
+                "unique_vehicle_count": unique_vins[0]["n"],
+                "report_types": [doc["_id"] for doc in facets.get("report_types", [])],
+                "event_types": [doc["_id"] for doc in facets.get("event_types", [])]
             }
             
         except PyMongoError as e:
@@ -5,13 +5,20 @@ Handles CRUD operations for vehicle entities.
 from typing import List, Optional
 from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorCollection
 from pymongo import ASCENDING
-from pymongo.errors import DuplicateKeyError, PyMongoError
+from pymongo.errors import BulkWriteError, DuplicateKeyError, PyMongoError
 from app.domain.models.vehicle import Vehicle
 from app.core.logging import get_logger
 from app.core.exceptions import RepositoryError, VehicleNotFoundError
 
 logger = get_logger(__name__)
 
+# Cap on per-document write errors carried in RepositoryError details
+MAX_REPORTED_WRITE_ERRORS = 20
+
+# Vehicle rejects unknown fields, so reads return only the model's fields
+# (stored documents may carry _id or keys added through update_vehicle)
+VEHICLE_PROJECTION = {"_id": 0, **{field: 1 for field in Vehicle.model_fields}}
+
 
 class VehicleRepository:
     """
@@ -84,25 +91,28 @@ class VehicleRepository:
                 details={"vin": vehicle.vin, "error": str(e)}
             ) from e
     
-    async def insert_many(self, vehicles: List[Vehicle]) -> List[str]:
+    async def insert_many(self, vehicles: List[Vehicle], ordered: bool = False) -> List[str]:
         """
         Insert multiple vehicles in bulk.
         
         Args:
             vehicles: List of Vehicle objects
+            ordered: Stop at the first failed document instead of inserting the rest
             
         Returns:
             List of inserted document IDs
             
         Raises:
-            RepositoryError: If bulk insert fails
+            RepositoryError: If bulk insert fails. On partial failure, details
+                carry "inserted" and "failed" counts plus a sample of
+                "write_errors" (input index, error code, message).
         """
         if not vehicles:
             return []
         
         try:
             documents = [vehicle.model_dump(mode='json') for vehicle in vehicles]
-            result = await self.collection.insert_many(documents, ordered=False)
+            result = await self.collection.insert_many(documents, ordered=ordered)
             
             logger.info(
                 f"Inserted {len(result.inserted_ids)} vehicles",
@@ -111,6 +121,27 @@ class VehicleRepository:
             
             return [str(id) for id in result.inserted_ids]
             
+        except BulkWriteError as e:
+            write_errors = e.details.get("writeErrors", [])
+            inserted = e.details.get("nInserted", 0)
+            failed = len(write_errors)
+            logger.warning(
+                f"Bulk vehicle insert partially failed - Inserted: {inserted}, Failed: {failed}",
+                extra={"inserted": inserted, "failed": failed}
+            )
+            raise RepositoryError(
+                "Bulk vehicle insert partially failed",
+                details={
+                    "count": len(vehicles),
+                    "inserted": inserted,
+                    "failed": failed,
+                    "write_errors": [
+                        {"index": err.get("index"), "code": err.get("code"), "message": err.get("errmsg")}
+                        for err in write_errors[:MAX_REPORTED_WRITE_ERRORS]
+                    ]
+                }
+            ) from e
+            
         except PyMongoError as e:
             logger.error("Bulk vehicle insert failed", exc_info=True)
             raise RepositoryError(
@@ -129,7 +160,7 @@ class VehicleRepository:
             Vehicle object or None if not found
         """
         try:
-            document = await self.collection.find_one({"vin": vin})
+            document = await self.collection.find_one({"vin": vin}, VEHICLE_PROJECTION)
             
             if document:
                 return Vehicle(**document)
@@ -151,7 +182,7 @@ class VehicleRepository:
             List of active Vehicle objects
         """
         try:
-            cursor = self.collection.find({"is_active": True})
+            cursor = self.collection.find({"is_active": True}, VEHICLE_PROJECTION)
             documents = await cursor.to_list(length=None)
             
             vehicles = [Vehicle(**doc) for doc in documents]
@@ -262,10 +293,11 @@ class VehicleRepository:
             int: Number of vehicles
         """
         try:
-            query = {"is_active": True} if active_only else {}
-            count = await self.collection.count_documents(query)
+            if active_only:
+                return await self.collection.count_documents({"is_active": True})
             
-            return count
+            # Unfiltered count comes from collection metadata, no scan needed
+            return await self.collection.estimated_document_count()
             
         except PyMongoError as e:
             logger.error("Failed to count vehicles", exc_info=True)
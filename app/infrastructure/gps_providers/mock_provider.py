@@ -3,15 +3,294 @@ Mock GPS Provider implementation for development and testing.
 Returns realistic static data matching the GPS API schema.
 """
 import asyncio
+import itertools
 import json
-from typing import Dict, Any
-from datetime import datetime
+import logging
+import random
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
+from datetime import datetime, timedelta, timezone
+import orjson
 from app.domain.interfaces.gps_provider import IGPSProvider
 from app.domain.models.enums import ReportType
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Provider-local RNG, independent of the shared module-level random state
+_rng = random.Random()
+
+# "0"/"1" flags indexed by a single random bit
+_BIT_STR = ("0", "1")
+
+# Monotonic suffix for unknown-VIN vehicle names; unique for the process lifetime
+_rand_counter = itertools.count(1)
+
+
+async def _no_network_delay(*args, **kwargs):
+    """Stand-in for _simulate_network_delay when latency simulation is off."""
+
+
+@lru_cache(maxsize=256)
+def _format_report_date(value: datetime) -> str:
+    """Format a date as the GPS API's dd-mm-YYYY; callers repeat a small set of dates."""
+    return value.strftime('%d-%m-%Y')
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to MappingProxyType and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Static mock payloads, built once at import
+_MOCK_SOURCE: Dict[ReportType, Dict[str, Any]] = {
+    ReportType.LAST_POS: {
+        "parsedData": {
+            "1006": {"VIN": "LSGHD52H9ND045496", "y": 19.899827, "x": -99.222737, "t": "2024-08-30T12:30:45.000"},
+            "1008": {"VIN": "3KPA24BC4NE453663", "y": 19.340975, "x": -99.121057, "t": "2024-08-30T12:40:50.000"},
+            "1009": {"VIN": "3KPA24BC2NE460675", "y": 19.365197, "x": -99.265575, "t": "2024-08-01T13:55:27.000"},
+            "1010": {"VIN": "MEX5B2605NT017117", "y": 19.64507, "x": -99.17114, "t": "2024-08-30T12:41:04.000"},
+            "1011": {"VIN": "MEX5B2602NT012229", "y": 19.397855, "x": -99.235578, "t": "2024-08-30T12:40:54.000"}
+        }
+    },
+    ReportType.ODOMETROS: {
+        "parsedData": {
+            "1006": {"VIN": "LSGHD52H9ND045496", "odo": "111214 km"},
+            "1008": {"VIN": "3KPA24BC4NE453663", "odo": "70870 km"},
+            "1009": {"VIN": "3KPA24BC2NE460675", "odo": "117964 km"},
+            "1010": {"VIN": "MEX5B2605NT017117", "odo": "45115 km"},
+            "1011": {"VIN": "MEX5B2602NT012229", "odo": "96691 km"}
+        }
+    },
+    ReportType.ENGINE_STATUS: {
+        "parsedData": {
+            "1006": {"VIN": "LSGHD52H9ND045496", "engineStatus": "0"},
+            "1008": {"VIN": "3KPA24BC4NE453663", "engineStatus": "0"},
+            "1009": {"VIN": "3KPA24BC2NE460675", "engineStatus": "0"},
+            "1010": {"VIN": "MEX5B2605NT017117", "engineStatus": "0"},
+            "1011": {"VIN": "MEX5B2602NT012229", "engineStatus": "0"}
+        }
+    },
+    ReportType.IGNITION: {
+        "parsedData": {
+            "1006": {"VIN": "LSGHD52H9ND045496", "date": "2024-08-30T12:30:45.000", "ignition": "0"},
+            "1008": {"VIN": "3KPA24BC4NE453663", "date": "2024-08-30T12:39:50.000", "ignition": "1"},
+            "1009": {"VIN": "3KPA24BC2NE460675", "date": "noDataInRange", "ignition": "0"},
+            "1010": {"VIN": "MEX5B2605NT017117", "date": "2024-08-30T12:39:42.000", "ignition": "0"},
+            "1011": {"VIN": "MEX5B2602NT012229", "date": "2024-08-30T12:39:47.000", "ignition": "1"}
+        }
+    },
+    ReportType.SPEED: {
+        "parsedData": {
+            "1006": {"VIN": "LSGHD52H9ND045496", "date": "2024-08-30T12:30:45.000", "speed": "0 km/h"},
+            "1008": {"VIN": "3KPA24BC4NE453663", "date": "2024-08-30T12:47:58.000", "speed": "0 km/h"},
+            "1009": {"VIN": "3KPA24BC2NE460675", "date": "2024-08-01T13:55:27.000", "speed": "0 km/h"},
+            "1010": {"VIN": "MEX5B2605NT017117", "date": "2024-08-30T12:46:38.000", "speed": "0 km/h"},
+            "1011": {"VIN": "MEX5B2602NT012229", "date": "2024-08-30T12:46:48.000", "speed": "16 km/h"}
+        }
+    },
+    ReportType.RECORRIDOS: {
+        "parsedData": {
+            "1006": {"VIN": "LSGHD52H9ND045496", "count": "3", "totalDuration": "3:02:43", "totalKm": "100 km"},
+            "1008": {"VIN": "3KPA24BC4NE453663", "count": "14", "totalDuration": "3:51:42", "totalKm": "59 km"},
+            "1009": {"VIN": "3KPA24BC2NE460675", "count": "0", "totalDuration": "0:00:00", "totalKm": "0.00 km"},
+            "1010": {"VIN": "MEX5B2605NT017117", "count": "11", "totalDuration": "0:00:00", "totalKm": "0.00 km"},
+            "1011": {"VIN": "MEX5B2602NT012229", "count": "12", "totalDuration": "8:04:33", "totalKm": "155 km"}
+        }
+    },
+    ReportType.ESTACIONAMIENTOS: {
+        "parsedData": {
+            "1006": {"VIN": "LSGHD52H9ND045496", "events": [{"duration": "4", "t": "noData", "y": "checkDayBefore", "x": "checkDayBefore"}]},
+            "1008": {"VIN": "3KPA24BC4NE453663", "events": [{"duration": "14", "t": "noData", "y": "checkDayBefore", "x": "checkDayBefore"}]},
+            "1009": {"VIN": "3KPA24BC2NE460675", "events": [{"duration": "0", "t": "noData", "y": "checkDayBefore", "x": "checkDayBefore"}]},
+            "1010": {"VIN": "MEX5B2605NT017117", "events": [{"duration": "12", "t": "noData", "y": "checkDayBefore", "x": "checkDayBefore"}]}
+        }
+    },
+    ReportType.CONSUMOS: {
+        "parsedData": {
+            "1006": {"VIN": "LSGHD52H9ND045496", "km": "", "timeOnMovement": "", "calculatedConsumption": "", "data": "noData"},
+            "1008": {"VIN": "3KPA24BC4NE453663", "km": "", "timeOnMovement": "", "calculatedConsumption": "", "data": "noData"},
+            "1009": {"VIN": "3KPA24BC2NE460675", "km": "", "timeOnMovement": "", "calculatedConsumption": "", "data": "noData"}
+        }
+    },
+    ReportType.VOLTAGE: {
+        "parsedData": {
+            "1006": {"VIN": "LSGHD52H9ND045496", "voltage": "12.6 V", "timestamp": "2024-08-30T12:30:45.000"},
+            "1008": {"VIN": "3KPA24BC4NE453663", "voltage": "12.4 V", "timestamp": "2024-08-30T12:40:50.000"},
+            "1009": {"VIN": "3KPA24BC2NE460675", "voltage": "11.8 V", "timestamp": "2024-08-01T13:55:27.000"}
+        }
+    }
+}
+
+# Deep-frozen view shared by every provider instance; consumers cannot mutate it
+_MOCK_DATA: Mapping[ReportType, Mapping[str, Any]] = _freeze(_MOCK_SOURCE)
+
+# Pre-serialized JSON for callers that only forward the payload
+# Serialization flags, resolved once; non-str keys tolerate enum-keyed payloads
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+_MOCK_BYTES: Dict[ReportType, bytes] = {
+    report_type: orjson.dumps(payload, option=_ORJSON_OPTIONS)
+    for report_type, payload in _MOCK_SOURCE.items()
+}
+
+_EMPTY_REPORT_BYTES = orjson.dumps({"parsedData": {}}, option=_ORJSON_OPTIONS)
+
+# Shared empty and single-vehicle response wrappers, built once and frozen so
+# callers can hold on to them without a return-to-pool protocol
+_EMPTY_REPORT: Mapping[str, Any] = _freeze({"parsedData": {}})
+
+_VEHICLE_REPORTS: Dict[tuple, Mapping[str, Any]] = {
+    (report_type, vehicle_name): MappingProxyType({"parsedData": MappingProxyType({vehicle_name: record})})
+    for report_type, payload in _MOCK_DATA.items()
+    for vehicle_name, record in payload["parsedData"].items()
+}
+
+# Reverse lookup (report_type, VIN) -> provider vehicle name
+_VIN_INDEX: Dict[tuple, str] = {
+    (report_type, record["VIN"]): vehicle_name
+    for report_type, payload in _MOCK_DATA.items()
+    for vehicle_name, record in payload["parsedData"].items()
+    if "VIN" in record
+}
+
+
+@lru_cache(maxsize=4096)
+def _cached_random_data(vin: str, report_type: ReportType) -> Mapping[str, Any]:
+    """
+    Random GPS data for an unknown VIN, memoized per (vin, report_type).
+    
+    Repeat lookups return the same deep-frozen payload, so it can be
+    shared between callers without copying.
+    """
+    return _freeze(_generate_random_data(vin, report_type))
+
+
+@lru_cache(maxsize=4096)
+def _random_vehicle_name(vin: str) -> str:
+    """Counter-based vehicle name for an unknown VIN, assigned once per VIN."""
+    return f"rand_{next(_rand_counter)}"
+
+
+def _random_timestamp(rng: random.Random) -> str:
+    """Random GPS-style timestamp within the last 24 hours."""
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    random_time = now - timedelta(hours=rng.randint(0, 24))
+    return random_time.strftime("%Y-%m-%dT%H:%M:%S.000")
+
+
+def _random_duration(rng: random.Random, max_hours: int) -> str:
+    """Random H:MM:SS duration string."""
+    return f"{rng.randint(0, max_hours)}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}"
+
+
+def _gen_last_pos(vin: str, rng: random.Random) -> Dict[str, Any]:
+    # Random coordinates around Mexico City area
+    base_lat, base_lon = 19.4326, -99.1332
+    return {
+        "VIN": vin,
+        "y": base_lat + rng.uniform(-0.5, 0.5),
+        "x": base_lon + rng.uniform(-0.5, 0.5),
+        "t": _random_timestamp(rng)
+    }
+
+
+def _gen_odometer(vin: str, rng: random.Random) -> Dict[str, Any]:
+    return {
+        "VIN": vin,
+        "odo": f"{rng.randint(10000, 200000)} km"
+    }
+
+
+def _gen_engine_status(vin: str, rng: random.Random) -> Dict[str, Any]:
+    return {
+        "VIN": vin,
+        "engineStatus": _BIT_STR[rng.getrandbits(1)]
+    }
+
+
+def _gen_ignition(vin: str, rng: random.Random) -> Dict[str, Any]:
+    return {
+        "VIN": vin,
+        "date": _random_timestamp(rng),
+        "ignition": _BIT_STR[rng.getrandbits(1)]
+    }
+
+
+def _gen_speed(vin: str, rng: random.Random) -> Dict[str, Any]:
+    return {
+        "VIN": vin,
+        "date": _random_timestamp(rng),
+        "speed": f"{rng.randint(0, 120)} km/h"
+    }
+
+
+def _gen_trips(vin: str, rng: random.Random) -> Dict[str, Any]:
+    return {
+        "VIN": vin,
+        "count": str(rng.randint(0, 20)),
+        "totalDuration": _random_duration(rng, 12),
+        "totalKm": f"{rng.randint(0, 500)} km"
+    }
+
+
+def _gen_parking(vin: str, rng: random.Random) -> Dict[str, Any]:
+    return {
+        "VIN": vin,
+        "events": [{
+            "duration": str(rng.randint(1, 24)),
+            "t": "noData",
+            "y": "checkDayBefore",
+            "x": "checkDayBefore"
+        }]
+    }
+
+
+def _gen_consumption(vin: str, rng: random.Random) -> Dict[str, Any]:
+    return {
+        "VIN": vin,
+        "km": f"{rng.randint(0, 100)} km" if rng.getrandbits(1) else "",
+        "timeOnMovement": _random_duration(rng, 8) if rng.getrandbits(1) else "",
+        "calculatedConsumption": f"{rng.uniform(5.0, 15.0):.1f} L/100km" if rng.getrandbits(1) else "",
+        "data": rng.choice(["noData", "available"])
+    }
+
+
+def _gen_voltage(vin: str, rng: random.Random) -> Dict[str, Any]:
+    return {
+        "VIN": vin,
+        "voltage": f"{rng.uniform(11.5, 13.0):.1f} V",
+        "timestamp": _random_timestamp(rng)
+    }
+
+
+def _gen_default(vin: str, rng: random.Random) -> Dict[str, Any]:
+    return {"VIN": vin}
+
+
+# Random payload generator per report type
+_GEN_DISPATCH = {
+    ReportType.LAST_POS: _gen_last_pos,
+    ReportType.ODOMETROS: _gen_odometer,
+    ReportType.ENGINE_STATUS: _gen_engine_status,
+    ReportType.IGNITION: _gen_ignition,
+    ReportType.SPEED: _gen_speed,
+    ReportType.RECORRIDOS: _gen_trips,
+    ReportType.ESTACIONAMIENTOS: _gen_parking,
+    ReportType.CONSUMOS: _gen_consumption,
+    ReportType.VOLTAGE: _gen_voltage,
+}
+
+
+def _generate_random_data(vin: str, report_type: ReportType) -> Dict[str, Any]:
+    """Generate random GPS data for an unknown VIN."""
+    return _GEN_DISPATCH.get(report_type, _gen_default)(vin, _rng)
+
 
 class MockGPSProvider(IGPSProvider):
     """
@@ -23,94 +302,15 @@ class MockGPSProvider(IGPSProvider):
     def __init__(self, simulate_latency: bool = True):
         self.simulate_latency = simulate_latency
         self._authenticated = False
-        self._mock_data = self._initialize_mock_data()
-    
-    def _initialize_mock_data(self) -> Dict[str, Any]:
-        """Initialize mock data for all report types."""
-        return {
-            ReportType.LAST_POS: {
-                "parsedData": {
-                    "1006": {"VIN": "LSGHD52H9ND045496", "y": 19.899827, "x": -99.222737, "t": "2024-08-30T12:30:45.000"},
-                    "1008": {"VIN": "3KPA24BC4NE453663", "y": 19.340975, "x": -99.121057, "t": "2024-08-30T12:40:50.000"},
-                    "1009": {"VIN": "3KPA24BC2NE460675", "y": 19.365197, "x": -99.265575, "t": "2024-08-01T13:55:27.000"},
-                    "1010": {"VIN": "MEX5B2605NT017117", "y": 19.64507, "x": -99.17114, "t": "2024-08-30T12:41:04.000"},
-                    "1011": {"VIN": "MEX5B2602NT012229", "y": 19.397855, "x": -99.235578, "t": "2024-08-30T12:40:54.000"}
-                }
-            },
-            ReportType.ODOMETROS: {
-                "parsedData": {
-                    "1006": {"VIN": "LSGHD52H9ND045496", "odo": "111214 km"},
-                    "1008": {"VIN": "3KPA24BC4NE453663", "odo": "70870 km"},
-                    "1009": {"VIN": "3KPA24BC2NE460675", "odo": "117964 km"},
-                    "1010": {"VIN": "MEX5B2605NT017117", "odo": "45115 km"},
-                    "1011": {"VIN": "MEX5B2602NT012229", "odo": "96691 km"}
-                }
-            },
-            ReportType.ENGINE_STATUS: {
-                "parsedData": {
-                    "1006": {"VIN": "LSGHD52H9ND045496", "engineStatus": "0"},
-                    "1008": {"VIN": "3KPA24BC4NE453663", "engineStatus": "0"},
-                    "1009": {"VIN": "3KPA24BC2NE460675", "engineStatus": "0"},
-                    "1010": {"VIN": "MEX5B2605NT017117", "engineStatus": "0"},
-                    "1011": {"VIN": "MEX5B2602NT012229", "engineStatus": "0"}
-                }
-            },
-            ReportType.IGNITION: {
-                "parsedData": {
-                    "1006": {"VIN": "LSGHD52H9ND045496", "date": "2024-08-30T12:30:45.000", "ignition": "0"},
-                    "1008": {"VIN": "3KPA24BC4NE453663", "date": "2024-08-30T12:39:50.000", "ignition": "1"},
-                    "1009": {"VIN": "3KPA24BC2NE460675", "date": "noDataInRange", "ignition": "0"},
-                    "1010": {"VIN": "MEX5B2605NT017117", "date": "2024-08-30T12:39:42.000", "ignition": "0"},
-                    "1011": {"VIN": "MEX5B2602NT012229", "date": "2024-08-30T12:39:47.000", "ignition": "1"}
-                }
-            },
-            ReportType.SPEED: {
-                "parsedData": {
-                    "1006": {"VIN": "LSGHD52H9ND045496", "date": "2024-08-30T12:30:45.000", "speed": "0 km/h"},
-                    "1008": {"VIN": "3KPA24BC4NE453663", "date": "2024-08-30T12:47:58.000", "speed": "0 km/h"},
-                    "1009": {"VIN": "3KPA24BC2NE460675", "date": "2024-08-01T13:55:27.000", "speed": "0 km/h"},
-                    "1010": {"VIN": "MEX5B2605NT017117", "date": "2024-08-30T12:46:38.000", "speed": "0 km/h"},
-                    "1011": {"VIN": "MEX5B2602NT012229", "date": "2024-08-30T12:46:48.000", "speed": "16 km/h"}
-                }
-            },
-            ReportType.RECORRIDOS: {
-                "parsedData": {
-                    "1006": {"VIN": "LSGHD52H9ND045496", "count": "3", "totalDuration": "3:02:43", "totalKm": "100 km"},
-                    "1008": {"VIN": "3KPA24BC4NE453663", "count": "14", "totalDuration": "3:51:42", "totalKm": "59 km"},
-                    "1009": {"VIN": "3KPA24BC2NE460675", "count": "0", "totalDuration": "0:00:00", "totalKm": "0.00 km"},
-                    "1010": {"VIN": "MEX5B2605NT017117", "count": "11", "totalDuration": "0:00:00", "totalKm": "0.00 km"},
-                    "1011": {"VIN": "MEX5B2602NT012229", "count": "12", "totalDuration": "8:04:33", "totalKm": "155 km"}
-                }
-            },
-            ReportType.ESTACIONAMIENTOS: {
-                "parsedData": {
-                    "1006": {"VIN": "LSGHD52H9ND045496", "events": [{"duration": "4", "t": "noData", "y": "checkDayBefore", "x": "checkDayBefore"}]},
-                    "1008": {"VIN": "3KPA24BC4NE453663", "events": [{"duration": "14", "t": "noData", "y": "checkDayBefore", "x": "checkDayBefore"}]},
-                    "1009": {"VIN": "3KPA24BC2NE460675", "events": [{"duration": "0", "t": "noData", "y": "checkDayBefore", "x": "checkDayBefore"}]},
-                    "1010": {"VIN": "MEX5B2605NT017117", "events": [{"duration": "12", "t": "noData", "y": "checkDayBefore", "x": "checkDayBefore"}]}
-                }
-            },
-            ReportType.CONSUMOS: {
-                "parsedData": {
-                    "1006": {"VIN": "LSGHD52H9ND045496", "km": "", "timeOnMovement": "", "calculatedConsumption": "", "data": "noData"},
-                    "1008": {"VIN": "3KPA24BC4NE453663", "km": "", "timeOnMovement": "", "calculatedConsumption": "", "data": "noData"},
-                    "1009": {"VIN": "3KPA24BC2NE460675", "km": "", "timeOnMovement": "", "calculatedConsumption": "", "data": "noData"}
-                }
-            },
-            ReportType.VOLTAGE: {
-                "parsedData": {
-                    "1006": {"VIN": "LSGHD52H9ND045496", "voltage": "12.6 V", "timestamp": "2024-08-30T12:30:45.000"},
-                    "1008": {"VIN": "3KPA24BC4NE453663", "voltage": "12.4 V", "timestamp": "2024-08-30T12:40:50.000"},
-                    "1009": {"VIN": "3KPA24BC2NE460675", "voltage": "11.8 V", "timestamp": "2024-08-01T13:55:27.000"}
-                }
-            }
-        }
+        self._mock_data = _MOCK_DATA
+        
+        # Bind the no-op once so call sites skip the latency branch entirely
+        if not simulate_latency:
+            self._simulate_network_delay = _no_network_delay
     
     async def _simulate_network_delay(self, min_delay: float = 0.1, max_delay: float = 2.0):
         """Simulate realistic network latency."""
-        if self.simulate_latency:
-            import random
-            await asyncio.sleep(random.uniform(min_delay, max_delay))
+        await asyncio.sleep(_rng.uniform(min_delay, max_delay))
     
     async def authenticate(self) -> bool:
         """Simulate authentication."""
@@ -125,13 +325,32 @@ class MockGPSProvider(IGPSProvider):
         **kwargs
     ) -> Dict[str, Any]:
         """Fetch mock report data."""
-        logger.info(f"Mock GPS Provider: Fetching {report_type.value} report", extra={"kwargs": kwargs})
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Mock GPS Provider: Fetching %s report", report_type.value, extra={"kwargs": kwargs})
         await self._simulate_network_delay()
         
-        if report_type in self._mock_data:
-            return self._mock_data[report_type]
+        return self._mock_data.get(report_type, _EMPTY_REPORT)
+    
+    async def get_report_bytes(
+        self,
+        report_type: ReportType,
+        **kwargs
+    ) -> bytes:
+        """Fetch mock report data as pre-serialized JSON bytes."""
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Mock GPS Provider: Fetching %s report bytes", report_type.value, extra={"kwargs": kwargs})
+        await self._simulate_network_delay()
+        
+        return _MOCK_BYTES.get(report_type, _EMPTY_REPORT_BYTES)
+    
+    def get_report_raw(self, report_type: ReportType) -> bytes:
+        """
+        Cached JSON bytes for a mock report, without simulated latency.
         
-        return {"parsedData": {}}
+        Same payload as get_report_bytes, returned synchronously so it can be
+        written straight into an HTTP response body.
+        """
+        return _MOCK_BYTES.get(report_type, _EMPTY_REPORT_BYTES)
     
     async def get_vehicle_data_by_vin(
         self,
@@ -139,37 +358,34 @@ class MockGPSProvider(IGPSProvider):
         report_type: ReportType
     ) -> Dict[str, Any]:
         """Fetch mock data for specific VIN."""
-        logger.info(f"Mock GPS Provider: Fetching {report_type.value} for VIN {vin}")
+        logger.info("Mock GPS Provider: Fetching %s for VIN %s", report_type.value, vin)
         await self._simulate_network_delay(0.5, 1.5)
         
-        report_data = self._mock_data.get(report_type, {}).get("parsedData", {})
-        
         # Find vehicle by VIN in existing mock data
-        for vehicle_name, vehicle_data in report_data.items():
-            if vehicle_data.get("VIN") == vin:
-                return {"parsedData": {vehicle_name: vehicle_data}}
+        vehicle_name = _VIN_INDEX.get((report_type, vin))
+        if vehicle_name is not None:
+            return _VEHICLE_REPORTS[(report_type, vehicle_name)]
         
         # If VIN not found in mock data, generate random data
-        logger.debug(f"VIN {vin} not in mock data, generating random response")
+        logger.debug("VIN %s not in mock data, generating random response", vin)
         random_data = self._generate_random_data_for_vin(vin, report_type)
         
         if random_data:
-            # Use a random vehicle name for unknown VINs
-            import random
-            vehicle_name = f"rand_{random.randint(2000, 9999)}"
+            # Stable per-VIN name, so repeat calls return identical responses
+            vehicle_name = _random_vehicle_name(vin)
             return {"parsedData": {vehicle_name: random_data}}
         
-        return {"parsedData": {}}
+        return _EMPTY_REPORT
     
     async def get_bulk_report(
         self,
         report_type: ReportType
     ) -> Dict[str, Any]:
         """Fetch bulk mock report (simulates slower response)."""
-        logger.info(f"Mock GPS Provider: Fetching bulk {report_type.value} report")
+        logger.info("Mock GPS Provider: Fetching bulk %s report", report_type.value)
         await self._simulate_network_delay(5.0, 10.0)  # Bulk is slower
         
-        return self._mock_data.get(report_type, {"parsedData": {}})
+        return self._mock_data.get(report_type, _EMPTY_REPORT)
     
     async def get_report_by_date(
         self,
@@ -177,10 +393,11 @@ class MockGPSProvider(IGPSProvider):
         date: datetime
     ) -> Dict[str, Any]:
         """Fetch mock report for specific date."""
-        logger.info(f"Mock GPS Provider: Fetching {report_type.value} for date {date.strftime('%d-%m-%Y')}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Mock GPS Provider: Fetching %s for date %s", report_type.value, _format_report_date(date))
         await self._simulate_network_delay()
         
-        return self._mock_data.get(report_type, {"parsedData": {}})
+        return self._mock_data.get(report_type, _EMPTY_REPORT)
     
     async def get_report_by_time_range(
         self,
@@ -190,10 +407,11 @@ class MockGPSProvider(IGPSProvider):
         end_date: datetime
     ) -> Dict[str, Any]:
         """Fetch mock report for time range."""
-        logger.info(
-            f"Mock GPS Provider: Fetching {report_type.value} for VIN {vin} "
-            f"from {start_date.strftime('%d-%m-%Y')} to {end_date.strftime('%d-%m-%Y')}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Mock GPS Provider: Fetching %s for VIN %s from %s to %s",
+                report_type.value, vin, _format_report_date(start_date), _format_report_date(end_date)
+            )
         await self._simulate_network_delay(1.0, 3.0)
         
         # Time range queries typically return single data point (as per docs)
@@ -205,15 +423,10 @@ class MockGPSProvider(IGPSProvider):
         vehicle_name: str
     ) -> Dict[str, Any]:
         """Fetch mock report by vehicle name."""
-        logger.info(f"Mock GPS Provider: Fetching {report_type.value} for vehicle name {vehicle_name}")
+        logger.info("Mock GPS Provider: Fetching %s for vehicle name %s", report_type.value, vehicle_name)
         await self._simulate_network_delay()
         
-        report_data = self._mock_data.get(report_type, {}).get("parsedData", {})
-        
-        if vehicle_name in report_data:
-            return {"parsedData": {vehicle_name: report_data[vehicle_name]}}
-        
-        return {"parsedData": {}}
+        return _VEHICLE_REPORTS.get((report_type, vehicle_name), _EMPTY_REPORT)
     
     async def health_check(self) -> bool:
         """Mock health check."""
@@ -221,94 +434,9 @@ class MockGPSProvider(IGPSProvider):
         await self._simulate_network_delay(0.1, 0.3)
         return True
     
-    def _generate_random_data_for_vin(self, vin: str, report_type: ReportType) -> Dict[str, Any]:
-        """Generate random GPS data for unknown VINs."""
-        import random
-        from datetime import datetime, timedelta
-        
-        # Generate random timestamp within last 24 hours
-        now = datetime.utcnow()
-        random_time = now - timedelta(hours=random.randint(0, 24))
-        timestamp = random_time.strftime("%Y-%m-%dT%H:%M:%S.000")
-        
-        base_data = {"VIN": vin}
-        
-        if report_type == ReportType.LAST_POS:
-            # Random coordinates around Mexico City area
-            base_lat, base_lon = 19.4326, -99.1332
-            lat_offset = random.uniform(-0.5, 0.5)
-            lon_offset = random.uniform(-0.5, 0.5)
-            
-            return {
-                **base_data,
-                "y": base_lat + lat_offset,
-                "x": base_lon + lon_offset,
-                "t": timestamp
-            }
-        
-        elif report_type == ReportType.ODOMETROS:
-            return {
-                **base_data,
-                "odo": f"{random.randint(10000, 200000)} km"
-            }
-        
-        elif report_type == ReportType.ENGINE_STATUS:
-            return {
-                **base_data,
-                "engineStatus": str(random.choice([0, 1]))
-            }
-        
-        elif report_type == ReportType.IGNITION:
-            return {
-                **base_data,
-                "date": timestamp,
-                "ignition": str(random.choice([0, 1]))
-            }
-        
-        elif report_type == ReportType.SPEED:
-            return {
-                **base_data,
-                "date": timestamp,
-                "speed": f"{random.randint(0, 120)} km/h"
-            }
-        
-        elif report_type == ReportType.RECORRIDOS:
-            return {
-                **base_data,
-                "count": str(random.randint(0, 20)),
-                "totalDuration": f"{random.randint(0, 12)}:{random.randint(0, 59):02d}:{random.randint(0, 59):02d}",
-                "totalKm": f"{random.randint(0, 500)} km"
-            }
-        
-        elif report_type == ReportType.ESTACIONAMIENTOS:
-            return {
-                **base_data,
-                "events": [{
-                    "duration": str(random.randint(1, 24)),
-                    "t": "noData",
-                    "y": "checkDayBefore",
-                    "x": "checkDayBefore"
-                }]
-            }
-        
-        elif report_type == ReportType.CONSUMOS:
-            return {
-                **base_data,
-                "km": f"{random.randint(0, 100)} km" if random.choice([True, False]) else "",
-                "timeOnMovement": f"{random.randint(0, 8)}:{random.randint(0, 59):02d}:{random.randint(0, 59):02d}" if random.choice([True, False]) else "",
-                "calculatedConsumption": f"{random.uniform(5.0, 15.0):.1f} L/100km" if random.choice([True, False]) else "",
-                "data": random.choice(["noData", "available"])
-            }
-        
-        elif report_type == ReportType.VOLTAGE:
-            voltage = random.uniform(11.5, 13.0)
-            return {
-                **base_data,
-                "voltage": f"{voltage:.1f} V",
-                "timestamp": timestamp
-            }
-        
-        return base_data
+    def _generate_random_data_for_vin(self, vin: str, report_type: ReportType) -> Mapping[str, Any]:
+        """Generate random GPS data for unknown VINs (stable per VIN and report type)."""
+        return _cached_random_data(vin, report_type)
 
     def get_provider_name(self) -> str:
         """Return provider identifier."""
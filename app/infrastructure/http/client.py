@@ -2,52 +2,71 @@
 Async HTTP client with retry logic, circuit breaker, and rate limiting.
 """
 import asyncio
+import logging
 from typing import Dict, Any, Optional
 from contextlib import asynccontextmanager
 import httpx
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-    before_sleep_log
-)
+import orjson
 from app.core.config import settings
 from app.core.logging import get_logger
 from app.core.exceptions import GPSProviderError, GPSProviderTimeout
 
 logger = get_logger(__name__)
 
+# Transient transport failures worth retrying
+RETRYABLE_EXCEPTIONS = (httpx.TimeoutException, httpx.ConnectError)
+
+# Upper bound on the backoff between retries, in seconds
+MAX_RETRY_BACKOFF = 30
+
+# Error response bodies are truncated to this many bytes in logs and errors
+ERROR_BODY_LIMIT = 1024
+
+# Repeated identical HTTP errors are logged once every N occurrences
+ERROR_LOG_SAMPLE_RATE = 100
+
+# Distinct (status, URL) pairs tracked for sampling before the counts are reset
+ERROR_COUNT_MAX_KEYS = 1024
+
 
 class RateLimiter:
-    """Token bucket rate limiter for API requests."""
+    """
+    GCRA (leaky bucket) rate limiter for API requests.
+    
+    Each caller reserves the next free time slot synchronously and then
+    sleeps until it, so concurrent callers wait in parallel instead of
+    queueing behind a lock held across the sleep.
+    """
     
     def __init__(self, rate: float):
         """
         Initialize rate limiter.
         
         Args:
-            rate: Maximum requests per second
+            rate: Maximum requests per second (also the burst size)
         """
         self.rate = rate
-        self.tokens = rate
-        self.updated_at = asyncio.get_event_loop().time()
-        self._lock = asyncio.Lock()
+        self.interval = 1.0 / rate
+        # Allow an initial burst of `rate` requests, like a full token bucket
+        self.burst_tolerance = max(0.0, rate - 1) * self.interval
+        self.next_free_time = 0.0
+        # Bound lazily on first acquire(); no loop may be running at construction
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
     
     async def acquire(self):
-        """Acquire a token, waiting if necessary."""
-        async with self._lock:
-            while self.tokens < 1:
-                now = asyncio.get_event_loop().time()
-                time_passed = now - self.updated_at
-                self.tokens = min(self.rate, self.tokens + time_passed * self.rate)
-                self.updated_at = now
-                
-                if self.tokens < 1:
-                    sleep_time = (1 - self.tokens) / self.rate
-                    await asyncio.sleep(sleep_time)
-            
-            self.tokens -= 1
+        """Acquire a slot, waiting if necessary."""
+        # No await between reading and updating next_free_time, so this
+        # reservation is atomic with respect to other coroutines
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        
+        now = self._loop.time()
+        slot = max(now, self.next_free_time)
+        self.next_free_time = slot + self.interval
+        
+        delay = slot - self.burst_tolerance - now
+        if delay > 0:
+            await asyncio.sleep(delay)
 
 
 class AsyncHTTPClient:
@@ -84,18 +103,7 @@ class AsyncHTTPClient:
         self.retry_backoff = retry_backoff
         self._client: Optional[httpx.AsyncClient] = None
         self._rate_limiter = RateLimiter(rate_limit) if rate_limit else None
-        
-        # Retry configuration
-        self._retry_decorator = retry(
-            stop=stop_after_attempt(max_retries),
-            wait=wait_exponential(multiplier=retry_backoff, min=1, max=30),
-            retry=retry_if_exception_type((
-                httpx.TimeoutException,
-                httpx.ConnectError,
-                httpx.ConnectTimeout
-            )),
-            before_sleep=before_sleep_log(logger, logger.level)
-        )
+        self._error_counts: Dict[tuple, int] = {}
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -132,12 +140,52 @@ class AsyncHTTPClient:
         if self._rate_limiter:
             await self._rate_limiter.acquire()
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=2, min=1, max=30),
-        retry=retry_if_exception_type((httpx.TimeoutException, httpx.ConnectError)),
-        before_sleep=before_sleep_log(logger, logger.level)
-    )
+    def _should_log_error(self, status_code: int, url: str) -> bool:
+        """Count an HTTP error and sample it: log the first, then every Nth repeat."""
+        key = (status_code, url)
+        if key not in self._error_counts and len(self._error_counts) >= ERROR_COUNT_MAX_KEYS:
+            # The client lives for the whole process; keep the map bounded
+            self._error_counts.clear()
+        count = self._error_counts.get(key, 0) + 1
+        self._error_counts[key] = count
+        return count % ERROR_LOG_SAMPLE_RATE == 1
+    
+    async def _request_with_retry(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """
+        Send a request, retrying transient failures with exponential backoff.
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint (relative to base_url)
+            **kwargs: Additional httpx parameters
+            
+        Returns:
+            httpx.Response of the first successful attempt
+            
+        Raises:
+            httpx.TimeoutException, httpx.ConnectError: If all attempts fail
+        """
+        attempts = max(1, self.max_retries)
+        
+        for attempt in range(attempts):
+            await self._apply_rate_limit()
+            
+            try:
+                return await self._client.request(method, endpoint, **kwargs)
+            except RETRYABLE_EXCEPTIONS as e:
+                if attempt == attempts - 1:
+                    raise
+                
+                delay = min(MAX_RETRY_BACKOFF, max(1, self.retry_backoff * 2 ** attempt))
+                
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning(
+                        "Retrying %s %s in %.1fs (attempt %d/%d): %s",
+                        method, endpoint, delay, attempt + 1, attempts, type(e).__name__
+                    )
+                
+                await asyncio.sleep(delay)
+    
     async def post(
         self,
         endpoint: str,
@@ -164,14 +212,14 @@ class AsyncHTTPClient:
         if not self._client:
             await self.start()
         
-        await self._apply_rate_limit()
-        
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         
         try:
-            logger.debug(f"POST {url}", extra={"payload": json_data})
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("POST %s", url, extra={"payload": json_data})
             
-            response = await self._client.post(
+            response = await self._request_with_retry(
+                "POST",
                 endpoint,
                 json=json_data,
                 headers=headers,
@@ -180,21 +228,30 @@ class AsyncHTTPClient:
             
             response.raise_for_status()
             
-            logger.debug(f"POST {url} succeeded", extra={"status_code": response.status_code})
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("POST %s succeeded", url, extra={"status_code": response.status_code})
             
-            return response.json()
+            return orjson.loads(response.content)
             
         except httpx.TimeoutException as e:
             logger.error(f"Request timeout for {url}", exc_info=True)
             raise GPSProviderTimeout(f"Request to {url} timed out after {self.timeout}s") from e
         
         except httpx.HTTPStatusError as e:
-            logger.error(
-                f"HTTP error {e.response.status_code} for {url}",
-                extra={"response": e.response.text}
+            status_code = e.response.status_code
+            # Decode only the truncated prefix rather than the whole body
+            body = e.response.content[:ERROR_BODY_LIMIT].decode(
+                e.response.encoding or "utf-8", errors="replace"
             )
+            
+            if self._should_log_error(status_code, url) and logger.isEnabledFor(logging.ERROR):
+                logger.error(
+                    "HTTP error %d for %s",
+                    status_code, url,
+                    extra={"response": body, "occurrences": self._error_counts[(status_code, url)]}
+                )
             raise GPSProviderError(
-                f"GPS API returned status {e.response.status_code}: {e.response.text}"
+                f"GPS API returned status {status_code}: {body}"
             ) from e
         
         except httpx.RequestError as e:
@@ -223,14 +280,14 @@ class AsyncHTTPClient:
         if not self._client:
             await self.start()
         
-        await self._apply_rate_limit()
-        
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         
         try:
-            logger.debug(f"GET {url}", extra={"params": params})
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("GET %s", url, extra={"params": params})
             
-            response = await self._client.get(
+            response = await self._request_with_retry(
+                "GET",
                 endpoint,
                 params=params,
                 headers=headers,
@@ -239,9 +296,10 @@ class AsyncHTTPClient:
             
             response.raise_for_status()
             
-            logger.debug(f"GET {url} succeeded", extra={"status_code": response.status_code})
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("GET %s succeeded", url, extra={"status_code": response.status_code})
             
-            return response.json()
+            return orjson.loads(response.content)
             
         except httpx.TimeoutException as e:
             logger.error(f"Request timeout for {url}", exc_info=True)
@@ -256,25 +314,64 @@ class AsyncHTTPClient:
             raise GPSProviderError(f"Connection failed: {str(e)}") from e
 
 
+# Process-wide client, started and closed by the FastAPI lifespan
+_GLOBAL_CLIENT: Optional[AsyncHTTPClient] = None
+
+
+def _create_http_client() -> AsyncHTTPClient:
+    """Build an HTTP client configured for the GPS API."""
+    return AsyncHTTPClient(
+        base_url=settings.GPS_API_BASE_URL,
+        timeout=settings.GPS_API_TIMEOUT,
+        max_retries=settings.GPS_API_MAX_RETRIES,
+        retry_backoff=settings.GPS_API_RETRY_BACKOFF,
+        rate_limit=settings.RATE_LIMIT_REQUESTS_PER_SECOND
+    )
+
+
+async def start_http_client() -> AsyncHTTPClient:
+    """
+    Start the shared HTTP client (idempotent).
+    
+    Returns:
+        The process-wide AsyncHTTPClient
+    """
+    global _GLOBAL_CLIENT
+    if _GLOBAL_CLIENT is None:
+        _GLOBAL_CLIENT = _create_http_client()
+        await _GLOBAL_CLIENT.start()
+    return _GLOBAL_CLIENT
+
+
+async def close_http_client():
+    """Close the shared HTTP client and its connection pool."""
+    global _GLOBAL_CLIENT
+    if _GLOBAL_CLIENT is not None:
+        await _GLOBAL_CLIENT.close()
+        _GLOBAL_CLIENT = None
+
+
 @asynccontextmanager
 async def get_http_client():
     """
     Dependency injection factory for HTTP client.
     
+    Yields the shared client started in the application lifespan, so its
+    connection pool (and TLS sessions) are reused across requests. Outside
+    the app (scripts, tests) a temporary client is created and closed.
+    
     Usage:
         async with get_http_client() as client:
             result = await client.post('/endpoint', json_data={...})
     """
-    client = AsyncHTTPClient(
-        base_url=settings.GPS_API_BASE_URL,
-        timeout=settings.GPS_API_TIMEOUT,
-        max_retries=settings.GPS_API_MAX_RETRIES,
-        retry_backoff=settings.GPS_API_RETRY_BACKOFF,
-        rate_limit=settings.RATE_LIMIT_REQUESTS_PER_SECOND
-    )
+    if _GLOBAL_CLIENT is not None:
+        yield _GLOBAL_CLIENT
+        return
+    
+    client = _create_http_client()
     
     try:
         await client.start()
         yield client
     finally:
-        await client.close()
\ No newline at end of file
+        await client.close()
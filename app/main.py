@@ -2,25 +2,18 @@
 FastAPI application entry point.
 Bootstraps the GPS data collection microservice with MongoDB Atlas.
 """
+import asyncio
+import time
 from contextlib import asynccontextmanager
-from datetime import datetime
+from datetime import datetime, timezone
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.core.config import settings
-from app.core.logging import setup_logging, get_logger
-from app.core.dependencies import get_container
+
 from app.api.v1.router import api_router
-from app.infrastructure.database.mongodb import get_mongodb_manager
-from app.scheduler.scheduler_manager import get_scheduler_manager
-from app.application.jobs.vehicle_position_job import run_vehicle_position_job
-from app.application.jobs.odometer_job import run_odometer_job
-from app.application.jobs.engine_status_job import run_engine_status_job
-from app.application.jobs.speed_monitoring_job import run_speed_monitoring_job
-from app.application.jobs.ignition_job import run_ignition_job
-from app.application.jobs.voltage_health_job import run_voltage_health_job
+from app.core.config import settings
+from app.core.logging import get_logger, setup_logging
 
-# Initialize logging
-setup_logging()
 logger = get_logger(__name__)
 
 
@@ -30,7 +23,17 @@ async def lifespan(app: FastAPI):
     Application lifespan manager.
     Handles startup and shutdown tasks.
     """
+    # Runtime dependencies are imported here rather than at module import,
+    # so loading app.main stays cheap until the process actually starts up
+    from app.core.dependencies import get_container
+    from app.infrastructure.database.mongodb import get_mongodb_manager
+    from app.infrastructure.http.client import close_http_client, start_http_client
+    from app.scheduler.scheduler_manager import get_scheduler_manager
+    
     # ============ STARTUP ============
+    # Logging is configured at startup rather than on import of app.main
+    setup_logging()
+    
     logger.info("=" * 60)
     logger.info("Starting GPS Data Collection Service")
     logger.info(f"Environment: {settings.ENVIRONMENT}")
@@ -38,19 +41,25 @@ async def lifespan(app: FastAPI):
     logger.info("=" * 60)
     
     try:
-        # 1. Connect to MongoDB Atlas
+        # 1. Connect to MongoDB Atlas, start the shared HTTP client and
+        #    initialize DB-free services concurrently; none depends on another
         logger.info("Connecting to MongoDB Atlas...")
+        logger.info("Initializing dependency container...")
         mongodb_manager = get_mongodb_manager()
-        db = await mongodb_manager.connect()
+        container = get_container()
+        db, _, _ = await asyncio.gather(
+            mongodb_manager.connect(),
+            start_http_client(),
+            container.initialize_services()
+        )
         if db is not None:
             logger.info("✓ MongoDB Atlas connection established")
         else:
             logger.warning("⚠ MongoDB Atlas connection failed - running in degraded mode")
+        logger.info("✓ HTTP client started")
         
-        # 2. Initialize dependency container
-        logger.info("Initializing dependency container...")
-        container = get_container()
-        await container.initialize()
+        # 2. Initialize MongoDB-backed repositories (needs the connection)
+        await container.initialize_repositories()
         logger.info("✓ Dependency container initialized")
         
         # 3. Initialize and start scheduler
@@ -58,10 +67,14 @@ async def lifespan(app: FastAPI):
         scheduler = get_scheduler_manager()
         scheduler.initialize()
         
+        # Start paused so jobs restored from a persistent job store are
+        # visible while registering; nothing fires until resume()
+        scheduler.start(paused=True)
+        
         # Register scheduled jobs
         await _register_scheduled_jobs(scheduler, container)
         
-        scheduler.start()
+        scheduler.resume()
         logger.info("✓ Scheduler started with registered jobs")
         
         logger.info("=" * 60)
@@ -93,7 +106,12 @@ async def lifespan(app: FastAPI):
         await container.cleanup()
         logger.info("✓ Dependencies cleaned up")
         
-        # 3. Close MongoDB connection
+        # 3. Close shared HTTP client
+        logger.info("Closing HTTP client...")
+        await close_http_client()
+        logger.info("✓ HTTP client closed")
+        
+        # 4. Close MongoDB connection
         logger.info("Closing MongoDB connection...")
         mongodb_manager = get_mongodb_manager()
         await mongodb_manager.disconnect()
@@ -107,15 +125,42 @@ async def lifespan(app: FastAPI):
         logger.error("Error during shutdown", exc_info=True)
 
 
+# Per-vehicle collection jobs: (job_id, module, function, cron expression, description).
+# Job modules are resolved lazily by the job runner when a job fires.
+_VEHICLE_JOBS = [
+    ("vehicle_position_collection", "app.application.jobs.vehicle_position_job", "run_vehicle_position_job",
+     settings.JOB_VEHICLE_POSITION_CRON, "Collect vehicle position data for all vehicles"),
+    ("odometer_collection", "app.application.jobs.odometer_job", "run_odometer_job",
+     settings.JOB_ODOMETER_CRON, "Collect odometer readings for all vehicles"),
+    ("engine_status_monitoring", "app.application.jobs.engine_status_job", "run_engine_status_job",
+     settings.JOB_ENGINE_STATUS_CRON, "Monitor engine status for all vehicles"),
+    ("speed_monitoring", "app.application.jobs.speed_monitoring_job", "run_speed_monitoring_job",
+     settings.JOB_SPEED_MONITORING_CRON, "Monitor vehicle speeds and detect violations"),
+    ("ignition_monitoring", "app.application.jobs.ignition_job", "run_ignition_job",
+     settings.JOB_IGNITION_CRON, "Monitor ignition status for all vehicles"),
+    ("voltage_health_check", "app.application.jobs.voltage_health_job", "run_voltage_health_job",
+     settings.JOB_VOLTAGE_HEALTH_CRON, "Monitor GPS device voltage health"),
+]
+
+
 async def _register_scheduled_jobs(scheduler, container):
     """Register all scheduled jobs with the scheduler."""
     
+    from app.scheduler.job_runner import run_retention_job, run_vehicle_job
+    
     # Get dependencies from container
-    gps_provider = container.get_gps_provider()
-    normalization_service = container.get_normalization_service()
     repository = container.get_repository()
     vehicle_repository = container.get_vehicle_repository()
     
+    # Retention runs regardless of fleet size; it only needs the repository
+    if repository is not None:
+        scheduler.add_cron_job(
+            func=run_retention_job,
+            job_id="telemetry_retention",
+            cron_expression=settings.JOB_TELEMETRY_RETENTION_CRON,
+            description="Drop expired weekly telemetry collections"
+        )
+    
     # Fetch vehicle VINs from database
     if vehicle_repository is not None:
         try:
@@ -138,77 +183,18 @@ async def _register_scheduled_jobs(scheduler, container):
     
     logger.info(f"Registering jobs for {len(vehicle_vins)} vehicles")
     
-    # Job 1: Vehicle Position Collection
-    scheduler.add_cron_job(
-        func=run_vehicle_position_job,
-        job_id="vehicle_position_collection",
-        cron_expression=settings.JOB_VEHICLE_POSITION_CRON,
-        description="Collect vehicle position data for all vehicles",
-        gps_provider=gps_provider,
-        normalization_service=normalization_service,
-        repository=repository,
-        vehicle_vins=vehicle_vins
-    )
-    
-    # Job 2: Odometer Collection
-    scheduler.add_cron_job(
-        func=run_odometer_job,
-        job_id="odometer_collection",
-        cron_expression=settings.JOB_ODOMETER_CRON,
-        description="Collect odometer readings for all vehicles",
-        gps_provider=gps_provider,
-        normalization_service=normalization_service,
-        repository=repository,
-        vehicle_vins=vehicle_vins
-    )
-    
-    # Job 3: Engine Status Monitoring
-    scheduler.add_cron_job(
-        func=run_engine_status_job,
-        job_id="engine_status_monitoring",
-        cron_expression=settings.JOB_ENGINE_STATUS_CRON,
-        description="Monitor engine status for all vehicles",
-        gps_provider=gps_provider,
-        normalization_service=normalization_service,
-        repository=repository,
-        vehicle_vins=vehicle_vins
-    )
-    
-    # Job 4: Speed Monitoring
-    scheduler.add_cron_job(
-        func=run_speed_monitoring_job,
-        job_id="speed_monitoring",
-        cron_expression=settings.JOB_SPEED_MONITORING_CRON,
-        description="Monitor vehicle speeds and detect violations",
-        gps_provider=gps_provider,
-        normalization_service=normalization_service,
-        repository=repository,
-        vehicle_vins=vehicle_vins
-    )
-    
-    # Job 5: Ignition Monitoring
-    scheduler.add_cron_job(
-        func=run_ignition_job,
-        job_id="ignition_monitoring",
-        cron_expression=settings.JOB_IGNITION_CRON,
-        description="Monitor ignition status for all vehicles",
-        gps_provider=gps_provider,
-        normalization_service=normalization_service,
-        repository=repository,
-        vehicle_vins=vehicle_vins
-    )
-    
-    # Job 6: Voltage Health Check
-    scheduler.add_cron_job(
-        func=run_voltage_health_job,
-        job_id="voltage_health_check",
-        cron_expression=settings.JOB_VOLTAGE_HEALTH_CRON,
-        description="Monitor GPS device voltage health",
-        gps_provider=gps_provider,
-        normalization_service=normalization_service,
-        repository=repository,
-        vehicle_vins=vehicle_vins
-    )
+    # Jobs carry only picklable arguments; the runner resolves live
+    # dependencies from the container at run time
+    for job_id, module_name, func_name, cron_expression, description in _VEHICLE_JOBS:
+        scheduler.add_cron_job(
+            func=run_vehicle_job,
+            job_id=job_id,
+            cron_expression=cron_expression,
+            description=description,
+            module_name=module_name,
+            func_name=func_name,
+            vehicle_vins=vehicle_vins
+        )
     
     jobs = scheduler.get_jobs()
     logger.info(f"✓ Registered {len(jobs)} scheduled jobs")
@@ -257,27 +243,47 @@ async def root():
     }
 
 
+# /health result is reused for this long, so frequent probes don't each ping MongoDB
+HEALTH_CACHE_TTL_SECONDS = 2.0
+
+_health_cache = {"checked_at": 0.0, "payload": None}
+_health_lock = asyncio.Lock()
+
+
 @app.get("/health", tags=["Health"])
 async def health_check():
     """
     Root level health check endpoint.
     Used by Docker healthcheck and load balancers.
+    
+    The result is cached for HEALTH_CACHE_TTL_SECONDS; concurrent probes
+    during a refresh wait for the single in-flight check.
     """
+    if time.monotonic() - _health_cache["checked_at"] < HEALTH_CACHE_TTL_SECONDS:
+        return _health_cache["payload"]
+    
+    async with _health_lock:
+        # Another probe may have refreshed the cache while we waited
+        if time.monotonic() - _health_cache["checked_at"] < HEALTH_CACHE_TTL_SECONDS:
+            return _health_cache["payload"]
+        
+        payload = await _run_health_checks()
+        _health_cache["payload"] = payload
+        _health_cache["checked_at"] = time.monotonic()
+        return payload
+
+
+async def _run_health_checks():
+    """Check MongoDB and the scheduler and build the /health payload."""
     from app.infrastructure.database.mongodb import get_mongodb_manager
+    from app.scheduler.scheduler_manager import get_scheduler_manager
     
-    # Check MongoDB connection
+    # Check MongoDB connection (ping handles its own errors)
     mongodb_manager = get_mongodb_manager()
     db = mongodb_manager.get_database()
-    mongodb_healthy = False
-    
-    if db is not None:
-        try:
-            mongodb_healthy = await mongodb_manager.ping()
-        except Exception:
-            mongodb_healthy = False
+    mongodb_healthy = db is not None and await mongodb_manager.ping()
     
-    # Check scheduler
-    from app.scheduler.scheduler_manager import get_scheduler_manager
+    # Check scheduler (in-memory state, no I/O)
     scheduler = get_scheduler_manager()
     scheduler_healthy = False
     
@@ -298,7 +304,7 @@ async def health_check():
             "mongodb": "healthy" if mongodb_healthy else "unhealthy",
             "scheduler": "healthy" if scheduler_healthy else "unhealthy"
         },
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds")
     }
 
 
@@ -310,6 +316,8 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=settings.DEBUG,
+        loop="uvloop",
+        http="httptools",
         log_level=settings.LOG_LEVEL.lower(),
         access_log=True
     )
\ No newline at end of file
@@ -0,0 +1,39 @@
+"""
+Persistable entry points for scheduled jobs.
+
+Jobs are registered against these module-level functions with plain,
+picklable arguments. Live dependencies (GPS provider, normalization service,
+repositories) are resolved from the dependency container when a job runs,
+so jobs can be stored in a persistent APScheduler job store.
+"""
+import importlib
+from typing import List
+
+from app.core.dependencies import get_container
+
+
+async def run_vehicle_job(module_name: str, func_name: str, vehicle_vins: List[str]):
+    """
+    Run a per-vehicle collection job with dependencies from the container.
+    
+    Args:
+        module_name: Module that defines the job function
+        func_name: Job function name (e.g., "run_vehicle_position_job")
+        vehicle_vins: VINs to process
+    """
+    container = get_container()
+    func = getattr(importlib.import_module(module_name), func_name)
+    
+    return await func(
+        gps_provider=container.get_gps_provider(),
+        normalization_service=container.get_normalization_service(),
+        repository=container.get_repository(),
+        vehicle_vins=vehicle_vins
+    )
+
+
+async def run_retention_job():
+    """Run the telemetry retention job with the container's repository."""
+    from app.application.jobs.telemetry_retention_job import run_telemetry_retention_job
+    
+    return await run_telemetry_retention_job(get_container().get_repository())
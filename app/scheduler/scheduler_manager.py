@@ -1,9 +1,13 @@
 """
 APScheduler management for cron-based GPS data collection jobs.
 """
+from __future__ import annotations
+
 import asyncio
-from typing import Callable
+from functools import lru_cache
+from typing import Callable, Optional
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.executors.asyncio import AsyncIOExecutor
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.jobstores.mongodb import MongoDBJobStore
 from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR
@@ -13,6 +17,28 @@ from app.core.logging import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _cron_trigger(cron_expression: str) -> CronTrigger:
+    """
+    Build a trigger from a crontab expression ("minute hour day month day_of_week").
+    
+    Triggers hold no per-job state, so jobs sharing an expression share one instance.
+    """
+    return CronTrigger.from_crontab(cron_expression, timezone=settings.SCHEDULER_TIMEZONE)
+
+
+class SharedClientMongoDBJobStore(MongoDBJobStore):
+    """
+    MongoDB job store on a client it does not own.
+    
+    The stock shutdown() closes the client; MongoDBManager owns the shared
+    client and closes it on disconnect, after running jobs have finished.
+    """
+    
+    def shutdown(self):
+        pass
+
+
 class SchedulerManager:
     """
     Manages APScheduler for executing scheduled GPS data collection jobs.
@@ -31,14 +57,29 @@ class SchedulerManager:
             mongodb_manager = get_mongodb_manager()
             db = mongodb_manager.get_database()
             
-            # Use memory job store for now to avoid APScheduler MongoDB issues
             jobstores = {}
-            logger.warning("Scheduler initialized with memory job store (using memory store for now)")
+            if settings.SCHEDULER_JOBSTORE == "mongodb" and db is not None:
+                # Share the app's connection pool (the job store needs the
+                # synchronous pymongo client that Motor wraps); the store
+                # creates its own next_run_time index when it starts
+                jobstores["default"] = SharedClientMongoDBJobStore(
+                    database=settings.MONGODB_DB_NAME,
+                    collection=settings.SCHEDULER_JOBSTORE_COLLECTION,
+                    client=mongodb_manager.get_client().delegate,
+                    pickle_protocol=5
+                )
+                logger.info("Scheduler using MongoDB job store on the shared client")
+            else:
+                logger.warning("Scheduler initialized with memory job store")
             
             job_defaults = settings.SCHEDULER_JOB_DEFAULTS
             
+            # Every job is a coroutine, so all of them run on the event loop
+            executors = {"default": AsyncIOExecutor()}
+            
             self.scheduler = AsyncIOScheduler(
                 jobstores=jobstores,
+                executors=executors,
                 job_defaults=job_defaults,
                 timezone=settings.SCHEDULER_TIMEZONE
             )
@@ -64,47 +105,50 @@ class SchedulerManager:
         job_id: str,
         cron_expression: str,
         description: str = "",
+        executor: str = "default",
         **kwargs
     ):
         """
         Add a cron-scheduled job.
         
         Args:
-            func: Async function to execute
+            func: Module-level async function to execute (persistent job
+                stores store it by reference)
             job_id: Unique identifier for the job
             cron_expression: Cron expression (e.g., "*/5 * * * *")
             description: Human-readable job description
-            **kwargs: Additional arguments to pass to the job function
+            executor: Executor alias
+            **kwargs: Additional arguments to pass to the job function; must be
+                picklable when a persistent job store is used
         """
         try:
-            # Parse cron expression: "minute hour day month day_of_week"
-            parts = cron_expression.split()
+            trigger = _cron_trigger(cron_expression)
             
-            trigger = CronTrigger(
-                minute=parts[0],
-                hour=parts[1],
-                day=parts[2],
-                month=parts[3],
-                day_of_week=parts[4] if len(parts) > 4 else '*'
-            )
+            # Keep an identical job as-is (e.g. one restored from a persistent
+            # job store) instead of rewriting it and resetting its next run
+            job = self.scheduler.get_job(job_id)
+            unchanged = job is not None and self._is_same_job(job, func, trigger, executor, kwargs)
             
-            job = self.scheduler.add_job(
-                func=func,
-                trigger=trigger,
-                id=job_id,
-                name=description or job_id,
-                replace_existing=True,
-                kwargs=kwargs
-            )
+            if not unchanged:
+                job = self.scheduler.add_job(
+                    func=func,
+                    trigger=trigger,
+                    id=job_id,
+                    name=description or job_id,
+                    replace_existing=True,
+                    executor=executor,
+                    kwargs=kwargs or None
+                )
             
             self._jobs_registry[job_id] = {
                 "function": func.__name__,
                 "cron": cron_expression,
-                "description": description
+                "description": description,
+                "executor": executor
             }
             
             logger.info(
-                f"Cron job added: {job_id}",
+                f"Cron job {'unchanged, kept' if unchanged else 'added'}: {job_id}",
                 extra={
                     "job_id": job_id,
                     "cron": cron_expression,
@@ -118,14 +162,32 @@ class SchedulerManager:
             logger.error(f"Failed to add cron job: {job_id}", exc_info=True)
             raise
     
-    def start(self):
-        """Start the scheduler."""
+    @staticmethod
+    def _is_same_job(job, func: Callable, trigger: CronTrigger, executor: str, kwargs: dict) -> bool:
+        """Whether an existing job already has this function, schedule, executor and arguments."""
+        # Compare full trigger state; str(CronTrigger) omits the timezone
+        return (
+            job.func == func
+            and type(job.trigger) is type(trigger)
+            and job.trigger.__getstate__() == trigger.__getstate__()
+            and job.executor == executor
+            and job.kwargs == kwargs
+        )
+    
+    def start(self, paused: bool = False):
+        """
+        Start the scheduler.
+        
+        Args:
+            paused: If True, start without running jobs until resume() is called.
+                Job stores are loaded, so persisted jobs can be looked up.
+        """
         if not self.scheduler:
             raise RuntimeError("Scheduler not initialized. Call initialize() first.")
         
         try:
-            self.scheduler.start()
-            logger.info("Scheduler started")
+            self.scheduler.start(paused=paused)
+            logger.info("Scheduler started (paused)" if paused else "Scheduler started")
             logger.info(
                 f"Active jobs: {len(self._jobs_registry)}",
                 extra={"jobs": list(self._jobs_registry.keys())}
@@ -134,6 +196,14 @@ class SchedulerManager:
             logger.error("Failed to start scheduler", exc_info=True)
             raise
     
+    def resume(self):
+        """Resume job processing after start(paused=True)."""
+        self.scheduler.resume()
+        logger.info(
+            f"Scheduler resumed - Active jobs: {len(self._jobs_registry)}",
+            extra={"jobs": list(self._jobs_registry.keys())}
+        )
+    
     def shutdown(self, wait: bool = True):
         """
         Shutdown the scheduler gracefully.
@@ -209,13 +279,7 @@ class SchedulerManager:
             )
 
 
-# Global scheduler instance
-_scheduler_manager = None
-
-
+@lru_cache()
 def get_scheduler_manager() -> SchedulerManager:
     """Get global scheduler manager instance."""
-    global _scheduler_manager
-    if _scheduler_manager is None:
-        _scheduler_manager = SchedulerManager()
-    return _scheduler_manager
\ No newline at end of file
+    return SchedulerManager()
\ No newline at end of file
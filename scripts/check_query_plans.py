@@ -0,0 +1,139 @@
+"""
+Query plan check for hot telemetry queries.
+Fails if find_by_vin needs an in-memory sort on any retained collection
+instead of walking the index.
+
+Usage:
+    python scripts/check_query_plans.py
+    python scripts/check_query_plans.py --vin 3KPA24BC4NE453663
+"""
+import asyncio
+import sys
+import argparse
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.infrastructure.database.mongodb import get_mongodb_manager
+from app.infrastructure.database.repositories.telemetry_repository import TelemetryRepository
+from app.core.logging import setup_logging, get_logger
+
+logger = get_logger(__name__)
+
+
+def find_stages(stage: dict, name: str) -> list[dict]:
+    """Collect every plan stage with the given name, walking nested input stages."""
+    found = [stage] if stage.get("stage") == name else []
+
+    children = list(stage.get("inputStages", []))
+    if "inputStage" in stage:
+        children.append(stage["inputStage"])
+
+    for child in children:
+        found.extend(find_stages(child, name))
+
+    return found
+
+
+def winning_plans(explain) -> list[tuple[str, dict]]:
+    """Collect (namespace, winning plan) for every collection an explain reads, including $unionWith sub-pipelines."""
+    plans = []
+
+    if isinstance(explain, dict):
+        planner = explain.get("queryPlanner")
+        if planner:
+            plan = planner.get("winningPlan", {})
+            # Slot-based engine plans nest the classic stage tree under queryPlan
+            plans.append((planner.get("namespace", "?"), plan.get("queryPlan", plan)))
+        for value in explain.values():
+            plans.extend(winning_plans(value))
+    elif isinstance(explain, list):
+        for item in explain:
+            plans.extend(winning_plans(item))
+
+    return plans
+
+
+def unpushed_sorts(stages: list) -> int:
+    """
+    Count $sort stages left in the aggregation layer for a single collection.
+
+    The $sort after the $unionWith stages merges the weeks and is expected;
+    any earlier $sort, or one inside a sub-pipeline, was not served by an index.
+    """
+    count = 0
+    seen_union = False
+
+    for stage in stages:
+        if "$unionWith" in stage:
+            seen_union = True
+            count += unpushed_sorts(stage["$unionWith"].get("pipeline", []))
+        elif "$sort" in stage and not seen_union:
+            count += 1
+
+    return count
+
+
+async def check_query_plans() -> bool:
+    """Explain the find_by_vin aggregate and verify no collection in it needs a SORT stage."""
+
+    parser = argparse.ArgumentParser(description='Check telemetry query plans')
+    parser.add_argument('--vin', default="3KPA24BC4NE453663", help='VIN used for the explained query')
+    args = parser.parse_args()
+
+    try:
+        mongodb_manager = get_mongodb_manager()
+        db = await mongodb_manager.connect()
+
+        if db is None:
+            logger.error("Failed to connect to MongoDB")
+            return False
+
+        repository = TelemetryRepository(db)
+        await repository.ensure_indexes()
+
+        # Hinted plan, plus an unhinted one so the index itself is under test
+        hinted = await repository.explain_find_by_vin(args.vin)
+        unhinted = await repository.explain_find_by_vin(args.vin, hint=False)
+
+        await mongodb_manager.disconnect()
+
+        passed = True
+        for mode, explain in (("hinted", hinted), ("unhinted", unhinted)):
+            plans = winning_plans(explain)
+            for namespace, plan in plans:
+                sort_stages = find_stages(plan, "SORT")
+                if sort_stages:
+                    logger.error(
+                        f"find_by_vin uses an in-memory SORT stage on {namespace} ({mode})",
+                        extra={"vin": args.vin, "namespace": namespace, "sort_stages": len(sort_stages)}
+                    )
+                    passed = False
+
+            sorts = unpushed_sorts(explain.get("stages", []))
+            if sorts:
+                logger.error(
+                    f"find_by_vin runs {sorts} $sort stages outside the index ({mode})",
+                    extra={"vin": args.vin, "sort_stages": sorts}
+                )
+                passed = False
+
+        if not passed:
+            return False
+
+        logger.info(
+            f"✓ find_by_vin is served by the (vin, recorded_at) index without SORT "
+            f"on {len(winning_plans(unhinted))} collections"
+        )
+        return True
+
+    except Exception:
+        logger.error("Query plan check failed", exc_info=True)
+        return False
+
+
+if __name__ == "__main__":
+    setup_logging()
+    success = asyncio.run(check_query_plans())
+    sys.exit(0 if success else 1)
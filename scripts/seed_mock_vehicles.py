@@ -5,6 +5,7 @@ Run this script to initialize the database with test vehicles.
 Usage:
     python scripts/seed_mock_vehicles.py
     python scripts/seed_mock_vehicles.py --count 100
+    python scripts/seed_mock_vehicles.py --count 100 --force
 """
 import asyncio
 import sys
@@ -20,65 +21,77 @@ from app.domain.models.vehicle import Vehicle
 from app.infrastructure.database.mongodb import get_mongodb_manager
 from app.infrastructure.database.repositories.vehicle_repository import VehicleRepository
 from app.core.logging import setup_logging, get_logger
+from app.core.exceptions import RepositoryError
 
-setup_logging()
 logger = get_logger(__name__)
 
+# VIN characters; I, O and Q are excluded to avoid confusion with 1 and 0
+_VIN_ALPHABET = tuple(c for c in string.ascii_uppercase + string.digits if c not in 'IOQ')
+_UPPER = string.ascii_uppercase
+_DIGITS = string.digits
 
-def generate_vin():
-    """Generate a random 17-character VIN."""
+
+def generate_vins(count: int) -> list[str]:
+    """Generate `count` random 17-character VINs from a single batched draw."""
     # VIN format: WMI (3) + VDS (6) + VIS (8) = 17 characters
-    # Exclude I, O, Q to avoid confusion
-    chars = string.ascii_uppercase + string.digits
-    chars = chars.replace('I', '').replace('O', '').replace('Q', '')
-    
-    return ''.join(random.choices(chars, k=17))
+    pool = ''.join(random.choices(_VIN_ALPHABET, k=17 * count))
+    return [pool[i:i + 17] for i in range(0, 17 * count, 17)]
+
 
+def generate_license_plates(count: int) -> list[str]:
+    """Generate `count` random license plates from two batched draws."""
+    letters = ''.join(random.choices(_UPPER, k=3 * count))
+    numbers = ''.join(random.choices(_DIGITS, k=3 * count))
+    return [f"{letters[i:i + 3]}-{numbers[i:i + 3]}" for i in range(0, 3 * count, 3)]
 
-def generate_license_plate():
-    """Generate a random license plate."""
-    letters = ''.join(random.choices(string.ascii_uppercase, k=3))
-    numbers = ''.join(random.choices(string.digits, k=3))
-    return f"{letters}-{numbers}"
+
+# Vehicle makes and models
+VEHICLE_DATA = [
+    ("Toyota", ["Camry", "Corolla", "RAV4", "Prius", "Highlander"]),
+    ("Honda", ["Civic", "Accord", "CR-V", "Pilot", "Fit"]),
+    ("Ford", ["F-150", "Escape", "Explorer", "Focus", "Mustang"]),
+    ("Chevrolet", ["Silverado", "Equinox", "Malibu", "Tahoe", "Cruze"]),
+    ("Nissan", ["Altima", "Sentra", "Rogue", "Pathfinder", "Versa"]),
+    ("Hyundai", ["Elantra", "Sonata", "Tucson", "Santa Fe", "Accent"]),
+    ("Kia", ["Optima", "Sorento", "Sportage", "Rio", "Soul"]),
+    ("Mazda", ["CX-5", "Mazda3", "CX-9", "Mazda6", "CX-3"]),
+    ("Subaru", ["Outback", "Forester", "Impreza", "Legacy", "Crosstrek"]),
+    ("Volkswagen", ["Jetta", "Passat", "Tiguan", "Atlas", "Golf"])
+]
+
+# Flattened (make, model) pairs so one draw picks both; every make has the
+# same number of models, so the distribution matches picking make then model
+MAKE_MODEL_PAIRS = [(make, model) for make, models in VEHICLE_DATA for model in models]
+
+# Fleet IDs
+FLEET_IDS = tuple(f"FLEET-{str(i).zfill(3)}" for i in range(1, 21))  # FLEET-001 to FLEET-020
 
 
 def generate_random_vehicles(count: int) -> list[Vehicle]:
     """Generate random vehicle data."""
     
-    # Vehicle makes and models
-    vehicle_data = [
-        ("Toyota", ["Camry", "Corolla", "RAV4", "Prius", "Highlander"]),
-        ("Honda", ["Civic", "Accord", "CR-V", "Pilot", "Fit"]),
-        ("Ford", ["F-150", "Escape", "Explorer", "Focus", "Mustang"]),
-        ("Chevrolet", ["Silverado", "Equinox", "Malibu", "Tahoe", "Cruze"]),
-        ("Nissan", ["Altima", "Sentra", "Rogue", "Pathfinder", "Versa"]),
-        ("Hyundai", ["Elantra", "Sonata", "Tucson", "Santa Fe", "Accent"]),
-        ("Kia", ["Optima", "Sorento", "Sportage", "Rio", "Soul"]),
-        ("Mazda", ["CX-5", "Mazda3", "CX-9", "Mazda6", "CX-3"]),
-        ("Subaru", ["Outback", "Forester", "Impreza", "Legacy", "Crosstrek"]),
-        ("Volkswagen", ["Jetta", "Passat", "Tiguan", "Atlas", "Golf"])
-    ]
-    
-    # Fleet IDs
-    fleet_ids = [f"FLEET-{str(i).zfill(3)}" for i in range(1, 21)]  # FLEET-001 to FLEET-020
+    # Draw every random field up front in batched calls
+    vins = generate_vins(count)
+    license_plates = generate_license_plates(count)
+    make_models = random.choices(MAKE_MODEL_PAIRS, k=count)
+    years = random.choices(range(2018, 2025), k=count)
+    fleets = random.choices(FLEET_IDS, k=count)
+    active_flags = random.choices([True, True, True, False], k=count)  # 75% active
+    names = [str(n) for n in range(1000, 1000 + count)]  # 1000, 1001, 1002, etc.
     
     vehicles = []
     
-    for i in range(count):
-        make, models = random.choice(vehicle_data)
-        model = random.choice(models)
-        year = random.randint(2018, 2024)
-        fleet_id = random.choice(fleet_ids)
-        
-        vehicle = Vehicle(
-            vin=generate_vin(),
-            vehicle_name=f"{1000 + i}",  # 1000, 1001, 1002, etc.
+    for i, ((make, model), year, fleet_id, is_active) in enumerate(zip(make_models, years, fleets, active_flags)):
+        # Generated fields are valid by construction, so skip validation
+        vehicle = Vehicle.model_construct(
+            vin=vins[i],
+            vehicle_name=names[i],
             make=make,
             model=model,
             year=year,
-            license_plate=generate_license_plate(),
+            license_plate=license_plates[i],
             fleet_id=fleet_id,
-            is_active=random.choice([True, True, True, False])  # 75% active
+            is_active=is_active
         )
         
         vehicles.append(vehicle)
@@ -148,6 +161,7 @@ async def seed_vehicles():
     parser = argparse.ArgumentParser(description='Seed mock vehicle data')
     parser.add_argument('--count', type=int, default=100, help='Number of vehicles to generate (default: 100)')
     parser.add_argument('--include-original', action='store_true', default=True, help='Include original 5 vehicles')
+    parser.add_argument('--force', '--yes', '-y', dest='force', action='store_true', help='Add vehicles even if the database already contains some')
     args = parser.parse_args()
     
     logger.info("=" * 60)
@@ -179,11 +193,11 @@ async def seed_vehicles():
         logger.info(f"Existing vehicles in database: {existing_count}")
         
         if existing_count > 0:
-            logger.warning("Database already contains vehicles")
-            response = input(f"Do you want to add {args.count} more vehicles? (y/n): ")
-            if response.lower() != 'y':
-                logger.info("Seeding cancelled by user")
+            if not args.force:
+                logger.error("Database already contains vehicles; pass --force (or --yes) to add more")
+                await mongodb_manager.disconnect()
                 return False
+            logger.warning(f"Database already contains vehicles; adding {args.count} more (--force)")
         
         # Generate vehicles
         logger.info(f"Generating {args.count} random vehicles...")
@@ -201,32 +215,23 @@ async def seed_vehicles():
         total_vehicles = len(vehicles_to_insert)
         logger.info(f"Total vehicles to insert: {total_vehicles}")
         
-        # Insert vehicles in batches
-        batch_size = 50
+        # Insert everything in one unordered bulk write; duplicates are
+        # reported back as write errors without aborting the rest
         inserted_count = 0
         skipped_count = 0
         
-        for i in range(0, total_vehicles, batch_size):
-            batch = vehicles_to_insert[i:i + batch_size]
-            batch_num = (i // batch_size) + 1
-            total_batches = (total_vehicles + batch_size - 1) // batch_size
-            
-            logger.info(f"Processing batch {batch_num}/{total_batches} ({len(batch)} vehicles)...")
-            
-            try:
-                await vehicle_repo.insert_many(batch)
-                inserted_count += len(batch)
-                logger.info(f"  ✓ Batch {batch_num} inserted successfully")
-            except Exception as e:
-                # Try individual inserts for this batch
-                logger.warning(f"  ⚠ Batch {batch_num} failed, trying individual inserts...")
-                for vehicle in batch:
-                    try:
-                        await vehicle_repo.insert_one(vehicle)
-                        inserted_count += 1
-                    except Exception as ve:
-                        skipped_count += 1
-                        logger.warning(f"    ⚠ Skipped: {vehicle.vin} - {str(ve)}")
+        try:
+            inserted_ids = await vehicle_repo.insert_many(vehicles_to_insert, ordered=False)
+            inserted_count = len(inserted_ids)
+        except RepositoryError as e:
+            if "inserted" not in e.details:
+                raise
+            inserted_count = e.details["inserted"]
+            skipped_count = e.details["failed"]
+            logger.warning(f"⚠ Skipped {skipped_count} vehicles that could not be inserted (e.g. duplicate VINs)")
+            for error in e.details.get("write_errors", []):
+                vehicle = vehicles_to_insert[error["index"]]
+                logger.warning(f"    ⚠ Skipped: {vehicle.vin} - {error['message']}")
         
         logger.info("=" * 60)
         logger.info(f"Seeding Complete!")
@@ -265,5 +270,6 @@ async def seed_vehicles():
 
 
 if __name__ == "__main__":
+    setup_logging()
     success = asyncio.run(seed_vehicles())
     sys.exit(0 if success else 1)
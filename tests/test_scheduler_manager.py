@@ -0,0 +1,48 @@
+"""
+Tests for deciding whether a registered cron job is kept or replaced.
+"""
+from types import SimpleNamespace
+
+import pytest
+from apscheduler.triggers.cron import CronTrigger
+
+from app.scheduler.scheduler_manager import SchedulerManager
+
+
+async def collect(vehicle_vins):
+    """Stand-in job function."""
+
+
+async def other_collect(vehicle_vins):
+    """Second stand-in job function."""
+
+
+def make_job(func=collect, cron="*/5 * * * *", timezone="UTC", executor="default", kwargs=None):
+    return SimpleNamespace(
+        func=func,
+        trigger=CronTrigger.from_crontab(cron, timezone=timezone),
+        executor=executor,
+        kwargs={"vehicle_vins": ["VIN1"]} if kwargs is None else kwargs
+    )
+
+
+def is_same(job, **overrides):
+    expected = make_job(**overrides)
+    return SchedulerManager._is_same_job(
+        job, expected.func, expected.trigger, expected.executor, expected.kwargs
+    )
+
+
+def test_identical_job_is_kept():
+    assert is_same(make_job())
+
+
+@pytest.mark.parametrize("overrides", [
+    {"func": other_collect},
+    {"cron": "*/10 * * * *"},
+    {"timezone": "Europe/Madrid"},
+    {"executor": "other"},
+    {"kwargs": {"vehicle_vins": ["VIN1", "VIN2"]}},
+])
+def test_changed_job_is_replaced(overrides):
+    assert not is_same(make_job(), **overrides)
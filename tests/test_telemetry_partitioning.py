@@ -0,0 +1,149 @@
+"""
+Tests for weekly telemetry collection naming, read fan-out and retention drops.
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from mongomock_motor import AsyncMongoMockClient
+
+from app.core.config import settings
+from app.domain.models.enums import ReportType, VehicleEventType
+from app.domain.models.vehicle_telemetry import IngestionMetadata, VehicleTelemetry
+from app.infrastructure.database.repositories import telemetry_repository
+from app.infrastructure.database.repositories.telemetry_repository import (
+    TelemetryRepository,
+    weekly_collection_end,
+    weekly_collection_name,
+)
+
+PREFIX = settings.TELEMETRY_COLLECTION
+
+
+def test_weekly_collection_name_uses_iso_year_and_week():
+    # 2021-01-03 is a Sunday that belongs to ISO week 53 of 2020
+    assert weekly_collection_name(datetime(2021, 1, 3, 12, 0)) == f"{PREFIX}_2020_w53"
+    assert weekly_collection_name(datetime(2024, 3, 5)) == f"{PREFIX}_2024_w10"
+
+
+def test_weekly_collection_end_is_following_monday():
+    name = weekly_collection_name(datetime(2024, 3, 5))
+
+    assert weekly_collection_end(name) == datetime(2024, 3, 11)
+
+
+def test_weekly_collection_end_round_trips_every_day_of_week():
+    monday = datetime(2024, 3, 4)
+
+    for offset in range(7):
+        moment = monday + timedelta(days=offset, hours=23)
+        assert weekly_collection_end(weekly_collection_name(moment)) == monday + timedelta(days=7)
+
+
+@pytest.mark.parametrize("name", [
+    f"{PREFIX}_2024_w00",
+    f"{PREFIX}_2024_w54",
+    f"{PREFIX}_2024_w99",
+    f"{PREFIX}_2021_w53",  # 2021 has only 52 ISO weeks
+    f"{PREFIX}_2024_w1",
+    PREFIX,
+    "job_execution_logs",
+])
+def test_weekly_collection_end_rejects_unparsable_names(name):
+    assert weekly_collection_end(name) is None
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Pin the repository clock to Wednesday of ISO week 2024-W20."""
+    now = datetime(2024, 5, 15, 12, 0)
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def utcnow(cls):
+            return now
+
+    monkeypatch.setattr(telemetry_repository, "datetime", FrozenDatetime)
+    monkeypatch.setattr(settings, "TELEMETRY_RETENTION_DAYS", 28)
+    return now
+
+
+@pytest.fixture
+def repository():
+    return TelemetryRepository(AsyncMongoMockClient()["test_telemetry"])
+
+
+def test_collection_names_cover_retention_newest_first_with_legacy_last(frozen_now, repository):
+    # 28 days before 2024-05-15 is 2024-04-17, in week 16
+    assert repository._collection_names() == [
+        f"{PREFIX}_2024_w20",
+        f"{PREFIX}_2024_w19",
+        f"{PREFIX}_2024_w18",
+        f"{PREFIX}_2024_w17",
+        f"{PREFIX}_2024_w16",
+        PREFIX,
+    ]
+
+
+def test_collection_names_skip_weeks_before_start_date(frozen_now, repository):
+    names = repository._collection_names(start_date=datetime(2024, 5, 7))
+
+    assert names == [f"{PREFIX}_2024_w20", f"{PREFIX}_2024_w19", PREFIX]
+
+
+def test_collection_names_ignore_start_date_older_than_retention(frozen_now, repository):
+    assert repository._collection_names(datetime(2023, 1, 1)) == repository._collection_names()
+
+
+async def test_drop_expired_collections_drops_only_weeks_ended_before_cutoff(frozen_now, repository):
+    # Cutoff is 2024-04-17: week 15 ended 2024-04-15, week 16 ends 2024-04-22
+    for name in (f"{PREFIX}_2024_w15", f"{PREFIX}_2024_w16", f"{PREFIX}_2024_w20", f"{PREFIX}_2024_w00"):
+        await repository.db[name].insert_one({"vin": "VIN"})
+    await repository.db[PREFIX].insert_one({"vin": "VIN", "created_at": "2024-05-01T08:00:00"})
+
+    dropped = await repository.drop_expired_collections()
+
+    assert dropped == [f"{PREFIX}_2024_w15"]
+    assert set(await repository.db.list_collection_names()) == {
+        f"{PREFIX}_2024_w16",
+        f"{PREFIX}_2024_w20",
+        f"{PREFIX}_2024_w00",
+        PREFIX,
+    }
+
+
+async def test_drop_expired_collections_drops_legacy_once_empty(frozen_now, repository):
+    await repository.db[PREFIX].insert_one({"vin": "VIN"})
+    await repository.db[PREFIX].delete_many({})
+
+    assert await repository.drop_expired_collections() == [PREFIX]
+
+
+async def test_drop_expired_collections_drops_legacy_once_newest_record_expires(frozen_now, repository):
+    # Cutoff is 2024-04-17; string timestamps never trigger the TTL index
+    await repository.db[PREFIX].insert_many([
+        {"vin": "VIN", "created_at": "2024-03-01T08:00:00"},
+        {"vin": "VIN", "created_at": "2024-04-16T23:59:59.500000"},
+    ])
+
+    assert await repository.drop_expired_collections() == [PREFIX]
+    assert PREFIX not in await repository.db.list_collection_names()
+
+
+def test_vin_query_bounds_compare_against_stored_recorded_at():
+    stored = VehicleTelemetry.__pydantic_serializer__.to_python(
+        VehicleTelemetry(
+            vin="3KPA24BC4NE453663",
+            event_type=VehicleEventType.POSITION_UPDATE,
+            metadata=IngestionMetadata(report_type=ReportType.LAST_POS, provider_name="mock"),
+            recorded_at=datetime(2024, 5, 15, 12, 30, 15)
+        ),
+        mode="json"
+    )["recorded_at"]
+
+    query = TelemetryRepository._vin_query(
+        "3KPA24BC4NE453663",
+        datetime(2024, 5, 15, 12, 0, tzinfo=timezone.utc),
+        datetime(2024, 5, 15, 13, 0)
+    )
+
+    assert query["recorded_at"]["$gte"] <= stored <= query["recorded_at"]["$lte"]
@@ -0,0 +1,50 @@
+"""
+Tests for vehicle repository reads and bulk insert error reporting.
+"""
+import pytest
+from mongomock_motor import AsyncMongoMockClient
+
+from app.core.exceptions import RepositoryError
+from app.domain.models.vehicle import Vehicle
+from app.infrastructure.database.repositories.vehicle_repository import (
+    MAX_REPORTED_WRITE_ERRORS,
+    VehicleRepository,
+)
+
+VIN = "3KPA24BC4NE453663"
+
+
+@pytest.fixture
+def repository():
+    return VehicleRepository(AsyncMongoMockClient()["test_vehicles"])
+
+
+async def test_find_by_vin_ignores_fields_outside_the_model(repository):
+    await repository.insert_one(Vehicle(vin=VIN, vehicle_name="1008"))
+    await repository.update_vehicle(VIN, {"notes": "x"})
+
+    vehicle = await repository.find_by_vin(VIN)
+
+    assert vehicle.vin == VIN
+    assert vehicle.vehicle_name == "1008"
+
+
+async def test_find_all_active_ignores_fields_outside_the_model(repository):
+    await repository.insert_one(Vehicle(vin=VIN))
+    await repository.update_vehicle(VIN, {"notes": "x"})
+
+    assert [vehicle.vin for vehicle in await repository.find_all_active()] == [VIN]
+
+
+async def test_insert_many_caps_reported_write_errors(repository):
+    await repository.ensure_indexes()
+    duplicates = [Vehicle(vin=VIN) for _ in range(MAX_REPORTED_WRITE_ERRORS + 5)]
+
+    with pytest.raises(RepositoryError) as exc_info:
+        await repository.insert_many(duplicates)
+
+    details = exc_info.value.details
+    assert details["inserted"] == 1
+    assert details["failed"] == MAX_REPORTED_WRITE_ERRORS + 4
+    assert len(details["write_errors"]) == MAX_REPORTED_WRITE_ERRORS
+    assert "error" not in details